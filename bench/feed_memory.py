@@ -0,0 +1,70 @@
+# bench/feed_memory.py
+"""Compare feed memory: the original dict/datetime layout vs feed.models.
+
+Usage: python bench/feed_memory.py [--sizes 10000 100000]
+"""
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import argparse
+import datetime
+import gc
+import tracemalloc
+
+from bench.feed_render import make_posts
+from feed.models import PostColumns
+
+def as_dicts(posts):
+    # The layout ui.py used to keep in st.session_state.posts
+    return [
+        {
+            'id': post.id,
+            'author': str(post.author),
+            'timestamp': datetime.datetime.fromtimestamp(post.created_at),
+            'content': post.content,
+            'tags': [str(tag) for tag in post.tags],
+            'replies': [
+                {
+                    'author': str(reply.author),
+                    'timestamp': datetime.datetime.fromtimestamp(reply.created_at),
+                    'content': reply.content,
+                }
+                for reply in post.replies
+            ],
+        }
+        for post in posts
+    ]
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    print(f"{'posts':>8} {'dicts (MB)':>11} {'slotted (MB)':>13} {'+columns (MB)':>14} {'saving':>7}")
+    for n in args.sizes:
+        dicts = measure(lambda: as_dicts(make_posts(n)))
+        slotted = measure(lambda: make_posts(n))
+
+        def with_columns():
+            posts = make_posts(n)
+            columns = PostColumns()
+            for post in posts:
+                columns.append(post)
+            return posts, columns
+
+        columnar = measure(with_columns)
+        print(f"{n:>8} {dicts / 2**20:>11.1f} {slotted / 2**20:>13.1f} {columnar / 2**20:>14.1f} "
+              f"{1 - slotted / dicts:>7.0%}")
+
+if __name__ == "__main__":
+    main()
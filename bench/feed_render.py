@@ -0,0 +1,91 @@
+# bench/feed_render.py
+"""Time Community Feed reruns of ui.py at different feed sizes.
+
+Usage: python bench/feed_render.py [--sizes 100 10000 100000] [--reruns 5]
+
+Each size runs in a fresh subprocess against its own temporary SQLite feed.
+"""
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import argparse
+import json
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+
+UI_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "ui.py"))
+
+TAGS = ["stress", "work", "sleep", "anxiety", "therapy", "hope", "support", "family", "study"]
+WORDS = ("feeling tired anxious hopeful today week sleep work therapy friends family "
+         "support overwhelmed better trying breathing walk talk help").split()
+
+def make_posts(n, seed=0):
+    from feed.models import Post, Reply
+
+    rng = random.Random(seed)
+    now = 1_735_689_600  # 2025-01-01
+    posts = []
+    for post_id in range(1, n + 1):
+        replies = [
+            Reply(f"User {rng.randrange(1000)}", now - 60 * rng.randrange(100000), " ".join(rng.choices(WORDS, k=12)))
+            for _ in range(rng.randrange(6))
+        ]
+        posts.append(Post(
+            post_id,
+            f"User {rng.randrange(1000)}",
+            now - 60 * rng.randrange(1000000),
+            " ".join(rng.choices(WORDS, k=30)),
+            rng.sample(TAGS, rng.randrange(4)),
+            replies,
+        ))
+    return posts
+
+def bench_size(n, reruns):
+    # Imported here so FEED_DB_PATH from the parent's environment is honoured
+    from streamlit.testing.v1 import AppTest
+    from feed.store import SQLitePostStore
+
+    SQLitePostStore(os.environ["FEED_DB_PATH"]).import_posts(make_posts(n))
+    at = AppTest.from_file(UI_PATH, default_timeout=600)
+
+    start = time.perf_counter()
+    at.run()  # first run also loads the feed and builds its index
+    first = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+    timings = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        at.run()
+        timings.append(time.perf_counter() - start)
+    return first, statistics.median(timings), len(at.markdown)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000, 100_000])
+    parser.add_argument("--reruns", type=int, default=5)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(bench_size(args.sizes[0], args.reruns)))
+        return
+
+    print(f"{'posts':>8} {'first run (s)':>14} {'rerun p50 (s)':>14} {'markdown elems':>15}")
+    for n in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            env = dict(os.environ, FEED_DB_PATH=os.path.join(tmp, "feed.sqlite"))
+            out = subprocess.run(
+                [sys.executable, __file__, "--child", "--sizes", str(n), "--reruns", str(args.reruns)],
+                env=env, capture_output=True, text=True, check=True,
+            ).stdout
+        first, rerun, elements = json.loads(out.strip().splitlines()[-1])
+        print(f"{n:>8} {first:>14.3f} {rerun:>14.3f} {elements:>15}")
+
+if __name__ == "__main__":
+    main()
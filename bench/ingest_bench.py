@@ -0,0 +1,143 @@
+# bench/ingest_bench.py
+"""Ingest and retrieval benchmarks over a synthetic Q&A workbook.
+
+Usage: python bench/ingest_bench.py [--rows 20000] [--latency-ms 1] [--output results.json]
+
+Runs offline against InMemoryGraphHandler by default (--backend neo4j uses
+the configured database instead). Results are printed and optionally written
+as JSON so runs can be diffed between commits.
+"""
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import tempfile
+import time
+from itertools import islice
+
+from bench.synthetic import generate_qa_rows, paraphrase, write_qa_file
+from config.settings import INGEST_BATCH_SIZE
+from graph.answer_cache import CachedAnswerLookup
+from graph.memory_handler import InMemoryGraphHandler
+from ingest.excel_ingest import ingest_excel_to_neo4j
+from ingest.normalize import RowNormalizer
+from ingest.readers import iter_qa_rows
+
+def percentiles(samples):
+    samples = sorted(samples)
+    pick = lambda p: samples[min(len(samples) - 1, int(p / 100 * len(samples)))]
+    return {
+        "p50_ms": 1000 * pick(50),
+        "p95_ms": 1000 * pick(95),
+        "p99_ms": 1000 * pick(99),
+        "max_ms": 1000 * samples[-1],
+    }
+
+def make_handler(backend, latency):
+    if backend == "neo4j":
+        from graph.neo4j_handler import Neo4jHandler
+        return Neo4jHandler()
+    return InMemoryGraphHandler(latency=latency)
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+def bench_parse(path):
+    count, seconds = timed(lambda: sum(1 for _ in iter_qa_rows(path)))
+    return {"rows": count, "seconds": seconds, "rows_per_sec": count / seconds}
+
+def bench_per_row(path, handler, limit):
+    def run():
+        rows = islice(RowNormalizer().process(iter_qa_rows(path)), limit)
+        written = 0
+        for question, answer in rows:
+            handler.add_question_answer(question, answer)
+            written += 1
+        return written
+    written, seconds = timed(run)
+    return {"rows": written, "seconds": seconds, "rows_per_sec": written / seconds}
+
+def bench_ingest(path, handler, workers, batch_size):
+    # Silence the ingester's progress prints so only results are shown
+    with contextlib.redirect_stdout(io.StringIO()):
+        written, seconds = timed(lambda: ingest_excel_to_neo4j(
+            path, batch_size=batch_size, workers=workers, handler=handler
+        ))
+    return {"rows": written, "seconds": seconds, "rows_per_sec": written / seconds, "workers": workers}
+
+def bench_retrieval(lookup, queries):
+    samples = []
+    for query in queries:
+        _, seconds = timed(lambda: lookup(query, 3))
+        samples.append(seconds)
+    return percentiles(samples)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--dup-rate", type=float, default=0.1)
+    parser.add_argument("--question-words", type=int, default=10)
+    parser.add_argument("--answer-words", type=int, default=40)
+    parser.add_argument("--format", choices=["xlsx", "csv"], default="xlsx")
+    parser.add_argument("--backend", choices=["memory", "neo4j"], default="memory")
+    parser.add_argument("--latency-ms", type=float, default=1.0,
+                        help="simulated round-trip latency for the memory backend")
+    parser.add_argument("--batch-size", type=int, default=INGEST_BATCH_SIZE)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--per-row-limit", type=int, default=2_000,
+                        help="rows to time in per-row mode (it is slow by design)")
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    args = parser.parse_args()
+    latency = args.latency_ms / 1000
+
+    results = {"config": vars(args), "python": platform.python_version()}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, f"qa.{args.format}")
+        _, seconds = timed(lambda: write_qa_file(path, generate_qa_rows(
+            args.rows, args.dup_rate, args.question_words, args.answer_words, args.seed
+        )))
+        results["generate_seconds"] = seconds
+        results["parse"] = bench_parse(path)
+
+        results["ingest"] = {
+            "per_row": bench_per_row(path, make_handler(args.backend, latency), args.per_row_limit),
+            "batched": bench_ingest(path, make_handler(args.backend, latency), 1, args.batch_size),
+        }
+        handler = make_handler(args.backend, latency)
+        results["ingest"]["parallel"] = bench_ingest(path, handler, args.workers, args.batch_size)
+
+        rng = random.Random(args.seed)
+        sample = [q for q, _ in islice(iter_qa_rows(path), 5_000)]
+        queries = [paraphrase(rng.choice(sample), rng) for _ in range(args.queries)]
+        # Chat traffic repeats itself: draw cached-lookup queries from a small pool
+        repeated = [rng.choice(queries[:50]) for _ in range(args.queries)]
+
+        from graph.vector_index import VectorIndex
+        index = VectorIndex(os.path.join(tmp, "vector_index"))
+        index.add([q for q, _ in RowNormalizer().process((q, "-") for q in sample)])
+
+        results["retrieval"] = {
+            "fulltext": bench_retrieval(handler.find_answers, queries),
+            "fulltext_cached": bench_retrieval(CachedAnswerLookup(handler.find_answers).find_answers, repeated),
+            "vector": bench_retrieval(
+                lambda text, k: handler.find_similar_answers(text, index, k=k), queries
+            ),
+        }
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# bench/synthetic.py
+"""Deterministic synthetic Q&A data shaped like the ingest input.
+
+Usage: python bench/synthetic.py out.xlsx [--rows 100000] [--dup-rate 0.1]
+"""
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import argparse
+import csv
+import random
+
+TOPICS = ("stress anxiety sleep insomnia panic grief loneliness burnout motivation focus "
+          "anger confidence relationships exams work therapy medication mood energy").split()
+VERBS = ("manage", "handle", "reduce", "cope with", "talk about", "understand", "deal with", "get over")
+CONTEXTS = ("at night", "at work", "before exams", "after a breakup", "on weekends",
+            "in the morning", "around family", "when I am alone", "during the holidays")
+FILLER = ("try breathing slowly and notice how your body feels then take a short walk "
+          "write down your thoughts talk to someone you trust keep a regular routine "
+          "limit caffeine rest when you can and consider speaking with a professional").split()
+
+def _question(rng, words):
+    extra = " ".join(rng.choices(TOPICS, k=max(0, words - 6)))
+    return (f"How can I {rng.choice(VERBS)} {rng.choice(TOPICS)} {rng.choice(CONTEXTS)} "
+            f"{extra}?").replace(" ?", "?")
+
+def _answer(rng, words):
+    return " ".join(rng.choices(FILLER, k=words)).capitalize() + "."
+
+def _variant(rng, text):
+    # A near-duplicate the normalizer should fold back into the original
+    return rng.choice((text.upper(), f"  {text} ", text.replace(" ", "  ")))
+
+def generate_qa_rows(rows, dup_rate=0.1, question_words=10, answer_words=40, seed=0):
+    """Yield `rows` (question, answer) pairs; about `dup_rate` of them repeat an
+    earlier pair exactly or as a case/whitespace variant.
+    """
+    rng = random.Random(seed)
+    produced = []
+    for _ in range(rows):
+        if produced and rng.random() < dup_rate:
+            question, answer = rng.choice(produced)
+            if rng.random() < 0.5:
+                question = _variant(rng, question)
+            yield question, answer
+            continue
+        pair = (_question(rng, question_words), _answer(rng, answer_words))
+        # Keep a bounded sample to draw duplicates from
+        if len(produced) < 10_000:
+            produced.append(pair)
+        else:
+            produced[rng.randrange(len(produced))] = pair
+        yield pair
+
+def paraphrase(question, rng):
+    """Drop one word and lower-case, as a user typing the question might."""
+    words = question.rstrip("?").split()
+    if len(words) > 3:
+        del words[rng.randrange(len(words))]
+    return " ".join(words).lower()
+
+def write_qa_file(path, rows):
+    """Write pairs to .xlsx (streamed, write-only workbook) or .csv."""
+    if path.lower().endswith(".csv"):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["questionText", "answerText"])
+            writer.writerows(rows)
+        return
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(["questionText", "answerText"])
+    for row in rows:
+        ws.append(row)
+    wb.save(path)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--dup-rate", type=float, default=0.1)
+    parser.add_argument("--question-words", type=int, default=10)
+    parser.add_argument("--answer-words", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    write_qa_file(args.path, generate_qa_rows(
+        args.rows, args.dup_rate, args.question_words, args.answer_words, args.seed
+    ))
+    print(f"[INFO] Wrote {args.rows} rows to {args.path}.")
+
+if __name__ == "__main__":
+    main()
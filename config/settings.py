@@ -8,3 +8,62 @@ load_dotenv()
 NEO4J_URI = os.getenv("NEO4J_URI", "bolt://localhost:7687")
 NEO4J_USER = os.getenv("NEO4J_USER", "neo4j")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "password")
+
+# Rows sent per UNWIND statement / transaction during bulk ingestion
+INGEST_BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", "1000"))
+
+# Rows read per chunk when streaming CSV / Parquet sources
+INGEST_CHUNK_SIZE = int(os.getenv("INGEST_CHUNK_SIZE", "10000"))
+
+# Parallel ingest: writer threads and chunks buffered between pipeline stages
+INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", "1"))
+INGEST_QUEUE_SIZE = int(os.getenv("INGEST_QUEUE_SIZE", "8"))
+
+# Shared driver connection pool (seconds for lifetime / timeout)
+NEO4J_MAX_POOL_SIZE = int(os.getenv("NEO4J_MAX_POOL_SIZE", "50"))
+NEO4J_MAX_CONNECTION_LIFETIME = float(os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", "3600"))
+NEO4J_CONNECTION_ACQUISITION_TIMEOUT = float(os.getenv("NEO4J_CONNECTION_ACQUISITION_TIMEOUT", "60"))
+
+# Support Chat answer cache: max cached messages and seconds before expiry
+ANSWER_CACHE_SIZE = int(os.getenv("ANSWER_CACHE_SIZE", "1024"))
+ANSWER_CACHE_TTL = float(os.getenv("ANSWER_CACHE_TTL", "600"))
+
+# Local semantic index over Question nodes (see graph/vector_index.py)
+VECTOR_INDEX_DIR = os.getenv(
+    "VECTOR_INDEX_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "vector_index"),
+)
+VECTOR_DIMS = int(os.getenv("VECTOR_DIMS", "256"))
+VECTOR_MIN_SCORE = float(os.getenv("VECTOR_MIN_SCORE", "0.35"))
+
+# Community Feed rendering: posts per "load more" page, replies shown before "show all"
+FEED_PAGE_SIZE = int(os.getenv("FEED_PAGE_SIZE", "20"))
+FEED_REPLY_PREVIEW = int(os.getenv("FEED_REPLY_PREVIEW", "3"))
+
+# Community Feed storage: "sqlite" (local file, WAL mode) or "neo4j"
+FEED_BACKEND = os.getenv("FEED_BACKEND", "sqlite")
+FEED_DB_PATH = os.getenv(
+    "FEED_DB_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "feed.sqlite"),
+)
+
+# Feed write-behind queue: max writes coalesced per transaction, and how long
+# a session waits for its own pending writes before rendering the feed
+FEED_WRITE_BATCH = int(os.getenv("FEED_WRITE_BATCH", "100"))
+FEED_WRITE_WAIT = float(os.getenv("FEED_WRITE_WAIT", "5"))
+
+# Metrics: off by default. Sink is "memory" (in-process only), "log" (print
+# a summary on flush) or "prometheus" (text exposition written to METRICS_FILE)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "0") == "1"
+METRICS_SINK = os.getenv("METRICS_SINK", "log")
+METRICS_FILE = os.getenv("METRICS_FILE", "metrics.prom")
+METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", "60"))
+
+# Transient database errors during ingest: retries per batch and the
+# exponential backoff range in seconds (full jitter)
+INGEST_MAX_RETRIES = int(os.getenv("INGEST_MAX_RETRIES", "5"))
+INGEST_RETRY_BASE_DELAY = float(os.getenv("INGEST_RETRY_BASE_DELAY", "0.5"))
+INGEST_RETRY_MAX_DELAY = float(os.getenv("INGEST_RETRY_MAX_DELAY", "30"))
+
+# Abort an ingest once more than this share of rows has been rejected
+INGEST_MAX_REJECT_RATIO = float(os.getenv("INGEST_MAX_REJECT_RATIO", "0.05"))
@@ -0,0 +1,69 @@
+# feed/index.py
+"""Incrementally maintained search/tag index over Community Feed posts."""
+import bisect
+import re
+
+from feed.models import PostColumns
+
+_WORD = re.compile(r"\w+")
+
+def tokenize(text):
+    return set(_WORD.findall(text.lower()))
+
+class FeedIndex:
+    """Token and tag -> post-id indexes plus columnar per-post sort keys.
+
+    Search matches a post when every query word is a prefix of some word in
+    its content or tags. Call add_post/add_reply whenever the feed changes.
+    """
+
+    def __init__(self, posts=()):
+        self.posts = {}
+        self.token_posts = {}
+        self.sorted_tokens = []
+        self.tag_posts = {}
+        self.columns = PostColumns()
+        for post in posts:
+            self.add_post(post)
+
+    def add_post(self, post):
+        post_id = post.id
+        self.posts[post_id] = post
+        words = tokenize(post.content)
+        for tag in post.tags:
+            words |= tokenize(tag)
+            self.tag_posts.setdefault(tag, set()).add(post_id)
+        for word in words:
+            ids = self.token_posts.get(word)
+            if ids is None:
+                ids = self.token_posts[word] = set()
+                bisect.insort(self.sorted_tokens, word)
+            ids.add(post_id)
+        self.columns.append(post)
+
+    def add_reply(self, post_id, reply):
+        self.posts[post_id].replies.append(reply)
+        self.columns.add_reply(post_id)
+
+    def tags(self):
+        return sorted(self.tag_posts)
+
+    def _prefix_matches(self, prefix):
+        ids = set()
+        i = bisect.bisect_left(self.sorted_tokens, prefix)
+        while i < len(self.sorted_tokens) and self.sorted_tokens[i].startswith(prefix):
+            ids |= self.token_posts[self.sorted_tokens[i]]
+            i += 1
+        return ids
+
+    def query(self, search_term="", tags=(), sort_by="Recent", limit=None):
+        """Return matching posts, best first, optionally only the top `limit`."""
+        ids = None
+        for word in tokenize(search_term):
+            matches = self._prefix_matches(word)
+            ids = matches if ids is None else ids & matches
+        if tags:
+            tagged = set().union(*(self.tag_posts.get(tag, ()) for tag in tags))
+            ids = tagged if ids is None else ids & tagged
+        top = self.columns.top(sort_by, ids, limit)
+        return [self.posts[post_id] for post_id in top]
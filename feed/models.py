@@ -0,0 +1,90 @@
+# feed/models.py
+"""Compact in-memory model for feed posts and replies.
+
+Post and Reply use __slots__, intern their tag and author strings (a few
+hundred distinct values shared by every post) and keep timestamps as epoch
+seconds. PostColumns holds the sort keys for a whole feed in flat arrays.
+"""
+import datetime
+import sys
+from array import array
+
+import numpy as np
+
+class Reply:
+    __slots__ = ("author", "created_at", "content")
+
+    def __init__(self, author, created_at, content):
+        self.author = sys.intern(author)
+        self.created_at = int(created_at)
+        self.content = content
+
+    @property
+    def timestamp(self):
+        return datetime.datetime.fromtimestamp(self.created_at)
+
+class Post:
+    __slots__ = ("id", "author", "created_at", "content", "tags", "replies")
+
+    def __init__(self, id, author, created_at, content, tags=(), replies=None):
+        self.id = id
+        self.author = sys.intern(author)
+        self.created_at = int(created_at)
+        self.content = content
+        self.tags = tuple(sys.intern(tag) for tag in tags)
+        self.replies = replies if replies is not None else []
+
+    @property
+    def timestamp(self):
+        return datetime.datetime.fromtimestamp(self.created_at)
+
+# Reply counts are shifted above the timestamp bits so one int64 key sorts
+# by replies first and recency second (epoch seconds fit in 35 bits).
+_REPLY_SHIFT = 35
+
+class PostColumns:
+    """Struct-of-arrays sort keys (id, created_at, reply count) for many posts."""
+
+    def __init__(self):
+        self.ids = array("q")
+        self.created_at = array("q")
+        self.reply_counts = array("q")
+        self.rows = {}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def append(self, post):
+        self.rows[post.id] = len(self.ids)
+        self.ids.append(post.id)
+        self.created_at.append(post.created_at)
+        self.reply_counts.append(len(post.replies))
+
+    def add_reply(self, post_id):
+        self.reply_counts[self.rows[post_id]] += 1
+
+    def _keys(self, sort_by):
+        # Zero-copy views over the arrays
+        created_at = np.frombuffer(self.created_at, dtype=np.int64)
+        if sort_by == "Recent":
+            return created_at
+        return (np.frombuffer(self.reply_counts, dtype=np.int64) << _REPLY_SHIFT) | created_at
+
+    def top(self, sort_by="Recent", post_ids=None, limit=None):
+        """Ids of the best `limit` posts (all if None), best first, optionally
+        restricted to `post_ids`.
+        """
+        if not self.ids:
+            return []
+        keys = self._keys(sort_by)
+        if post_ids is None:
+            rows = np.arange(len(self.ids))
+        else:
+            rows = np.fromiter((self.rows[post_id] for post_id in post_ids), dtype=np.int64)
+        subset = keys[rows]
+        if limit is not None and limit < len(rows):
+            part = np.argpartition(-subset, limit - 1)[:limit]
+            rows, subset = rows[part], subset[part]
+        order = rows[np.argsort(-subset, kind="stable")]
+        ids = np.frombuffer(self.ids, dtype=np.int64)
+        return ids[order].tolist()
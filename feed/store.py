@@ -0,0 +1,294 @@
+# feed/store.py
+"""Persistent post/reply storage shared by every session of the app.
+
+Backends expose the same small interface (write_batch, import_posts,
+all_posts, version). CachedFeed wraps one of them with a
+process-wide FeedIndex for reads and a write-behind queue for writes.
+"""
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import wait
+
+from config.settings import FEED_BACKEND, FEED_DB_PATH
+from feed.index import FeedIndex
+from feed.models import Post, Reply
+from feed.writer import WriteBehindQueue
+
+# Queued write operations; write_batch returns a Post / Reply for each
+NewPost = namedtuple("NewPost", "author content tags created_at")
+NewReply = namedtuple("NewReply", "post_id author content created_at")
+
+def _now(created_at):
+    return int(created_at) if created_at is not None else int(time.time())
+
+SQLITE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS posts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        author TEXT NOT NULL,
+        created_at INTEGER NOT NULL,
+        content TEXT NOT NULL,
+        reply_count INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE TABLE IF NOT EXISTS post_tags (
+        post_id INTEGER NOT NULL REFERENCES posts (id),
+        position INTEGER NOT NULL,
+        tag TEXT NOT NULL,
+        PRIMARY KEY (post_id, position)
+    );
+    CREATE TABLE IF NOT EXISTS replies (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        post_id INTEGER NOT NULL REFERENCES posts (id),
+        author TEXT NOT NULL,
+        created_at INTEGER NOT NULL,
+        content TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS replies_post ON replies (post_id, id);
+"""
+
+class SQLitePostStore:
+    def __init__(self, path=FEED_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn().executescript(SQLITE_SCHEMA)
+
+    def _conn(self):
+        # sqlite3 connections are per thread; Streamlit runs sessions on several
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # Off by default in SQLite; makes a reply to an unknown post fail
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+        return conn
+
+    def write_batch(self, ops):
+        """Apply NewPost / NewReply ops in one transaction."""
+        conn = self._conn()
+        results = []
+        with conn:
+            for op in ops:
+                if isinstance(op, NewPost):
+                    post_id = self._insert_post(conn, op.author, op.created_at, op.content, op.tags)
+                    results.append(Post(post_id, op.author, op.created_at, op.content, op.tags))
+                else:
+                    self._insert_reply(conn, op.post_id, op.author, op.created_at, op.content)
+                    results.append(Reply(op.author, op.created_at, op.content))
+        return results
+
+    def _insert_post(self, conn, author, created_at, content, tags):
+        cur = conn.execute(
+            "INSERT INTO posts (author, created_at, content) VALUES (?, ?, ?)",
+            (author, created_at, content),
+        )
+        post_id = cur.lastrowid
+        conn.executemany(
+            "INSERT INTO post_tags (post_id, position, tag) VALUES (?, ?, ?)",
+            [(post_id, i, tag) for i, tag in enumerate(tags)],
+        )
+        return post_id
+
+    def _insert_reply(self, conn, post_id, author, created_at, content):
+        conn.execute(
+            "INSERT INTO replies (post_id, author, created_at, content) VALUES (?, ?, ?, ?)",
+            (post_id, author, created_at, content),
+        )
+        conn.execute("UPDATE posts SET reply_count = reply_count + 1 WHERE id = ?", (post_id,))
+
+    def import_posts(self, posts):
+        """Bulk-insert Posts (ids are reassigned) in one transaction."""
+        conn = self._conn()
+        with conn:
+            for post in posts:
+                post_id = self._insert_post(conn, post.author, post.created_at, post.content, post.tags)
+                for reply in post.replies:
+                    self._insert_reply(conn, post_id, reply.author, reply.created_at, reply.content)
+
+    def version(self):
+        """(last post id, last reply id): grows by one per post or reply
+        added, by any process.
+        """
+        return self._conn().execute(
+            "SELECT (SELECT COALESCE(MAX(id), 0) FROM posts), (SELECT COALESCE(MAX(id), 0) FROM replies)"
+        ).fetchone()
+
+    def _hydrate(self, rows):
+        if not rows:
+            return []
+        conn = self._conn()
+        ids = [row[0] for row in rows]
+        tags = {post_id: [] for post_id in ids}
+        replies = {post_id: [] for post_id in ids}
+        tag_rows = conn.execute("SELECT post_id, tag FROM post_tags ORDER BY post_id, position")
+        reply_rows = conn.execute(
+            "SELECT post_id, author, created_at, content FROM replies ORDER BY post_id, id"
+        )
+        for post_id, tag in tag_rows:
+            if post_id in tags:
+                tags[post_id].append(tag)
+        for post_id, author, created_at, content in reply_rows:
+            if post_id in replies:
+                replies[post_id].append(Reply(author, created_at, content))
+        return [
+            Post(post_id, author, created_at, content, tags[post_id], replies[post_id])
+            for post_id, author, created_at, content in rows
+        ]
+
+    def all_posts(self):
+        rows = self._conn().execute("SELECT id, author, created_at, content FROM posts ORDER BY id").fetchall()
+        return self._hydrate(rows)
+
+class Neo4jPostStore:
+    """Stores the feed as (:Post)-[:TAGGED]->(:Tag) and (:Reply)-[:REPLY_TO]->(:Post)."""
+
+    def __init__(self, handler=None):
+        if handler is None:
+            from graph.neo4j_handler import Neo4jHandler
+            handler = Neo4jHandler()
+        self.handler = handler
+        self.handler.ensure_schema()
+
+    def write_batch(self, ops):
+        """Apply NewPost / NewReply ops in one transaction."""
+        from graph.neo4j_handler import ADD_REPLY_QUERY, CREATE_POST_QUERY
+
+        statements = []
+        for op in ops:
+            if isinstance(op, NewPost):
+                statements.append((CREATE_POST_QUERY, {
+                    "author": op.author, "content": op.content,
+                    "tags": list(op.tags), "created_at": op.created_at,
+                }))
+            else:
+                statements.append((ADD_REPLY_QUERY, {
+                    "post_id": op.post_id, "author": op.author,
+                    "content": op.content, "created_at": op.created_at,
+                }))
+        # A reply to an unknown post matches nothing; fail the batch instead
+        records = self.handler.write_statements(statements, require_rows=True)
+        return [
+            Post(rows[0]["id"], op.author, op.created_at, op.content, op.tags)
+            if isinstance(op, NewPost) else Reply(op.author, op.created_at, op.content)
+            for op, rows in zip(ops, records)
+        ]
+
+    def import_posts(self, posts):
+        for post in posts:
+            [created] = self.write_batch([NewPost(post.author, post.content, post.tags, post.created_at)])
+            self.write_batch([
+                NewReply(created.id, reply.author, reply.content, reply.created_at) for reply in post.replies
+            ])
+
+    def version(self):
+        return self.handler.feed_version()
+
+    def _hydrate(self, rows):
+        return [
+            Post(
+                row['id'], row['author'], row['created_at'], row['content'], row['tags'],
+                [Reply(r['author'], r['created_at'], r['content']) for r in row['replies']],
+            )
+            for row in rows
+        ]
+
+    def all_posts(self):
+        return self._hydrate(self.handler.feed_posts())
+
+class CachedFeed:
+    """Process-wide read cache and write-behind queue over a store.
+
+    Reads are served from an in-memory FeedIndex. Writes are queued and
+    return a Future; once a batch commits it is applied to the index in place.
+    Writes from other processes are picked up by rebuilding the index when
+    the store's version moves.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._lock = threading.Lock()
+        self._index = None
+        self._version = None
+        self._writer = WriteBehindQueue(self._apply_batch)
+
+    def _fresh_index(self):
+        version = self.store.version()
+        if self._index is None or version != self._version:
+            self._index = FeedIndex(self.store.all_posts())
+            self._version = version
+        return self._index
+
+    def _apply_batch(self, ops):
+        # Runs on the writer thread; readers are only locked out while the
+        # committed batch is folded into the index, not during the write.
+        with self._lock:
+            index, version = self._index, self._version
+        results = self.store.write_batch(ops)
+        with self._lock:
+            # A reader that rebuilt the index meanwhile already sees this batch
+            if index is not None and self._index is index:
+                posts = sum(isinstance(op, NewPost) for op in ops)
+                expected = (version[0] + posts, version[1] + len(ops) - posts)
+                if self.store.version() != expected:
+                    # Another process wrote too; its rows are not in the index
+                    self._index = None
+                    return results
+                try:
+                    for op, result in zip(ops, results):
+                        if isinstance(op, NewPost):
+                            index.add_post(result)
+                        else:
+                            index.add_reply(op.post_id, result)
+                    self._version = expected
+                except Exception:
+                    # The batch is committed, so this must not reach the
+                    # writer's per-op retry; rebuild from the store instead.
+                    self._index = None
+        return results
+
+    def is_empty(self):
+        with self._lock:
+            return not self._fresh_index().posts
+
+    def tags(self):
+        with self._lock:
+            return self._fresh_index().tags()
+
+    def query(self, search_term="", tags=(), sort_by="Recent", limit=None):
+        with self._lock:
+            return self._fresh_index().query(search_term, tags, sort_by, limit)
+
+    def create_post(self, author, content, tags, created_at=None):
+        """Queue a new post; returns a Future resolving to the stored Post."""
+        return self._writer.submit(NewPost(author, content, tuple(tags), _now(created_at)))
+
+    def add_reply(self, post_id, author, content, created_at=None):
+        """Queue a reply; returns a Future resolving to the stored Reply."""
+        return self._writer.submit(NewReply(post_id, author, content, _now(created_at)))
+
+    def wait(self, futures, timeout=None):
+        """Read-your-writes: block until the given queued writes are applied.
+        Returns the futures that completed.
+        """
+        done, _ = wait(futures, timeout)
+        return done
+
+    def flush(self, timeout=None):
+        self._writer.flush(timeout)
+
+    def import_posts(self, posts):
+        self.flush()
+        with self._lock:
+            self.store.import_posts(posts)
+            self._index = None
+
+def open_feed(backend=FEED_BACKEND, path=FEED_DB_PATH):
+    if backend == "neo4j":
+        return CachedFeed(Neo4jPostStore())
+    if backend == "sqlite":
+        return CachedFeed(SQLitePostStore(path))
+    raise ValueError(f"Unknown feed backend: {backend}")
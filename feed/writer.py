@@ -0,0 +1,76 @@
+# feed/writer.py
+"""Write-behind queue: callers enqueue writes and get a Future back at once.
+
+A single background thread owns the backend session, drains whatever has
+queued up (up to `max_batch` items) and applies it as one transaction, so
+submit latency does not depend on backend latency.
+"""
+import atexit
+import queue
+import threading
+from concurrent.futures import Future
+
+from config.settings import FEED_WRITE_BATCH
+
+_STOP = object()
+
+class WriteBehindQueue:
+    def __init__(self, apply_batch, max_batch=FEED_WRITE_BATCH, name="feed-writer"):
+        """`apply_batch(ops)` must apply all ops in one transaction and return
+        one result per op. It must raise only if that transaction did not
+        commit: a failed batch is retried op by op.
+        """
+        self.apply_batch = apply_batch
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, op):
+        future = Future()
+        self._queue.put((op, future))
+        return future
+
+    def flush(self, timeout=None):
+        """Block until everything submitted before this call has been applied."""
+        barrier = Future()
+        self._queue.put((None, barrier))
+        barrier.result(timeout)
+
+    def close(self):
+        if self._thread.is_alive():
+            self._queue.put((_STOP, None))
+            self._thread.join()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = any(op is _STOP for op, _ in batch)
+            writes = [(op, future) for op, future in batch if op is not None and op is not _STOP]
+            if writes:
+                self._apply(writes)
+            for op, future in batch:
+                if op is None:
+                    future.set_result(None)
+            if stop:
+                return
+
+    def _apply(self, writes):
+        try:
+            results = self.apply_batch([op for op, _ in writes])
+        except Exception:
+            # Retry one by one so a single bad write doesn't fail its neighbours
+            for op, future in writes:
+                try:
+                    future.set_result(self.apply_batch([op])[0])
+                except Exception as e:
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(writes, results):
+            future.set_result(result)
@@ -0,0 +1,69 @@
+# graph/answer_cache.py
+"""Bounded LRU + TTL cache in front of answer retrieval."""
+import threading
+import time
+from collections import OrderedDict
+
+from config.settings import ANSWER_CACHE_SIZE, ANSWER_CACHE_TTL
+
+def _cache_key(text, k):
+    return " ".join(text.casefold().split()), k
+
+class CachedAnswerLookup:
+    """Wraps a `lookup(text, k)` callable (e.g. Neo4jHandler.find_answers).
+
+    Messages that differ only in case or whitespace share an entry. Safe to
+    share across Streamlit sessions.
+    """
+
+    def __init__(self, lookup, maxsize=ANSWER_CACHE_SIZE, ttl=ANSWER_CACHE_TTL):
+        self.lookup = lookup
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.lookup_seconds = 0.0
+        self.last_lookup_seconds = 0.0
+
+    def find_answers(self, text, k=3):
+        key = _cache_key(text, k)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        start = time.perf_counter()
+        results = self.lookup(text, k)
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self.lookup_seconds += elapsed
+            self.last_lookup_seconds = elapsed
+            self._entries[key] = (now + self.ttl, results)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return results
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "avg_lookup_ms": 1000 * self.lookup_seconds / self.misses if self.misses else 0.0,
+                "last_lookup_ms": 1000 * self.last_lookup_seconds,
+            }
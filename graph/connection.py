@@ -0,0 +1,46 @@
+# graph/connection.py
+"""One pooled neo4j driver per process, shared by ingest and the app."""
+import atexit
+import threading
+
+from neo4j import GraphDatabase
+
+from config.settings import (
+    NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+    NEO4J_MAX_CONNECTION_LIFETIME,
+    NEO4J_MAX_POOL_SIZE,
+    NEO4J_PASSWORD,
+    NEO4J_URI,
+    NEO4J_USER,
+)
+
+_drivers = {}
+_lock = threading.Lock()
+
+def get_driver(uri=None, user=None, password=None):
+    """Return the process-wide driver for these credentials, creating it once."""
+    key = (uri or NEO4J_URI, user or NEO4J_USER, password or NEO4J_PASSWORD)
+    with _lock:
+        driver = _drivers.get(key)
+        if driver is None:
+            driver = GraphDatabase.driver(
+                key[0],
+                auth=(key[1], key[2]),
+                max_connection_pool_size=NEO4J_MAX_POOL_SIZE,
+                max_connection_lifetime=NEO4J_MAX_CONNECTION_LIFETIME,
+                connection_acquisition_timeout=NEO4J_CONNECTION_ACQUISITION_TIMEOUT,
+            )
+            driver.verify_connectivity()
+            _drivers[key] = driver
+            print("[INFO] Connected to Neo4j.")
+        return driver
+
+def close_drivers():
+    with _lock:
+        for driver in _drivers.values():
+            driver.close()
+        if _drivers:
+            print("[INFO] Neo4j connection pool closed.")
+        _drivers.clear()
+
+atexit.register(close_drivers)
@@ -0,0 +1,108 @@
+# graph/memory_handler.py
+"""In-memory stand-in for Neo4jHandler, for offline and reproducible runs.
+
+Implements the Q&A part of the Neo4jHandler interface. An optional
+per-round-trip `latency` (seconds) simulates network cost, so per-row,
+batched and parallel ingest modes compare the way they would against a
+real server.
+"""
+import re
+import threading
+import time
+from itertools import islice
+
+from config.settings import INGEST_BATCH_SIZE
+from graph.neo4j_handler import text_hash
+
+_WORD = re.compile(r"\w+")
+
+class InMemoryGraphHandler:
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.questions = {}  # question text -> set of answer hashes
+        self.answers = {}    # answer hash -> answer text
+        self.tokens = {}     # word -> set of question texts
+        self.round_trips = 0
+        self._lock = threading.Lock()
+
+    def _round_trip(self):
+        self.round_trips += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def ensure_schema(self):
+        return []
+
+    def _add(self, question, answer):
+        a_hash = text_hash(answer)
+        self.answers.setdefault(a_hash, answer)
+        if question not in self.questions:
+            self.questions[question] = set()
+            for word in set(_WORD.findall(question.lower())):
+                self.tokens.setdefault(word, set()).add(question)
+        self.questions[question].add(a_hash)
+
+    def add_question_answer(self, question, answer):
+        self._round_trip()
+        with self._lock:
+            self._add(question, answer)
+
+    def add_question_answers(self, rows, batch_size=INGEST_BATCH_SIZE):
+        rows = iter(rows)
+        written = 0
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                return written
+            self._round_trip()
+            with self._lock:
+                for question, answer in batch:
+                    self._add(question, answer)
+            written += len(batch)
+
+    def remove_question_answers(self, rows, batch_size=INGEST_BATCH_SIZE):
+        rows = iter(rows)
+        removed = 0
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                return removed
+            self._round_trip()
+            with self._lock:
+                for question, answer in batch:
+                    self.questions.get(question, set()).discard(text_hash(answer))
+            removed += len(batch)
+
+    def find_answers(self, text, k=3):
+        self._round_trip()
+        words = set(_WORD.findall(text.lower()))
+        scores = {}
+        with self._lock:
+            for word in words:
+                for question in self.tokens.get(word, ()):
+                    scores[question] = scores.get(question, 0) + 1
+            best = sorted(scores, key=scores.get, reverse=True)
+            results = []
+            for question in best:
+                for a_hash in self.questions[question]:
+                    results.append({
+                        "question": question,
+                        "answer": self.answers[a_hash],
+                        "score": scores[question] / len(words),
+                    })
+                if len(results) >= k:
+                    break
+        return results[:k]
+
+    def find_similar_answers(self, text, index, k=3, min_score=0.0):
+        hits = index.search([text], k=k, min_score=min_score)[0]
+        self._round_trip()
+        results = []
+        with self._lock:
+            for question, score in hits:
+                for a_hash in self.questions.get(question, ()):
+                    results.append({"question": question, "answer": self.answers[a_hash], "score": score})
+        return results[:k]
+
+    def close(self):
+        pass
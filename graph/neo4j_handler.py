@@ -1,18 +1,345 @@
 # graph/neo4j_handler.py
-from py2neo import Graph
+import hashlib
+import re
+import time
+from itertools import islice
+
+from config.settings import INGEST_BATCH_SIZE
+from graph.connection import get_driver
+from ingest.normalize import normalize_question
+from telemetry import metrics
+
+ADD_QA_QUERY = """
+    MERGE (q:Question {text: $q_text})
+    MERGE (a:Answer {hash: $a_hash})
+      ON CREATE SET a.text = $a_text
+    MERGE (q)-[:HAS_ANSWER]->(a)
+"""
+
+ADD_QA_BATCH_QUERY = """
+    UNWIND $rows AS row
+    MERGE (q:Question {text: row.q_text})
+    MERGE (a:Answer {hash: row.a_hash})
+      ON CREATE SET a.text = row.a_text
+    MERGE (q)-[:HAS_ANSWER]->(a)
+"""
+
+REMOVE_QA_BATCH_QUERIES = (
+    """
+    UNWIND $rows AS row
+    MATCH (q:Question {text: row.q_text})-[r:HAS_ANSWER]->(a:Answer {hash: row.a_hash})
+    DELETE r
+    """,
+    # Drop nodes the retraction left without any relationships
+    """
+    UNWIND $rows AS row
+    MATCH (q:Question {text: row.q_text})
+    WHERE NOT (q)--()
+    DELETE q
+    """,
+    """
+    UNWIND $rows AS row
+    MATCH (a:Answer {hash: row.a_hash})
+    WHERE NOT (a)--()
+    DELETE a
+    """,
+)
+
+# Answers can exceed the index key size limit, so they are keyed by a hash
+# of their text rather than the text itself.
+SCHEMA_CONSTRAINTS = {
+    "question_text_unique":
+        "CREATE CONSTRAINT question_text_unique IF NOT EXISTS "
+        "FOR (q:Question) REQUIRE q.text IS UNIQUE",
+    "answer_hash_unique":
+        "CREATE CONSTRAINT answer_hash_unique IF NOT EXISTS "
+        "FOR (a:Answer) REQUIRE a.hash IS UNIQUE",
+    "post_id_unique":
+        "CREATE CONSTRAINT post_id_unique IF NOT EXISTS "
+        "FOR (p:Post) REQUIRE p.id IS UNIQUE",
+    "tag_name_unique":
+        "CREATE CONSTRAINT tag_name_unique IF NOT EXISTS "
+        "FOR (t:Tag) REQUIRE t.name IS UNIQUE",
+    "counter_name_unique":
+        "CREATE CONSTRAINT counter_name_unique IF NOT EXISTS "
+        "FOR (c:Counter) REQUIRE c.name IS UNIQUE",
+}
+
+SCHEMA_INDEXES = {
+    "question_text_fulltext":
+        "CREATE FULLTEXT INDEX question_text_fulltext IF NOT EXISTS "
+        "FOR (q:Question) ON EACH [q.text]",
+}
+
+# Questions are MERGEd on their normalized (case-folded) text. Graphs written
+# before that are migrated once by _normalize_question_texts: legacy nodes are
+# renamed, or merged into the node that already has the normalized text.
+QUESTION_TEXT_MIGRATION = "question_text_normalized"
+
+MERGE_QUESTIONS_QUERY = """
+    UNWIND $rows AS row
+    MATCH (old:Question) WHERE id(old) = row.id
+    MATCH (keep:Question) WHERE id(keep) = row.keep
+    OPTIONAL MATCH (old)-[:HAS_ANSWER]->(a:Answer)
+    FOREACH (_ IN CASE WHEN a IS NULL THEN [] ELSE [1] END | MERGE (keep)-[:HAS_ANSWER]->(a))
+    WITH DISTINCT old
+    DETACH DELETE old
+"""
+
+RENAME_QUESTIONS_QUERY = """
+    UNWIND $rows AS row
+    MATCH (q:Question) WHERE id(q) = row.id
+    SET q.text = row.text
+"""
+
+FIND_ANSWERS_QUERY = """
+    CALL db.index.fulltext.queryNodes('question_text_fulltext', $query) YIELD node, score
+    MATCH (node)-[:HAS_ANSWER]->(a:Answer)
+    RETURN node.text AS question, a.text AS answer, score
+    ORDER BY score DESC
+    LIMIT $k
+"""
+
+ANSWERS_FOR_QUESTIONS_QUERY = """
+    UNWIND $questions AS question
+    MATCH (q:Question {text: question})-[:HAS_ANSWER]->(a:Answer)
+    RETURN q.text AS question, a.text AS answer
+"""
+
+# Community Feed storage (feed/store.py). Ids come from Counter nodes so they
+# are monotonic; the counter MERGE/SET takes a write lock on the node.
+CREATE_POST_QUERY = """
+    MERGE (c:Counter {name: 'post'})
+    SET c.value = coalesce(c.value, 0) + 1
+    CREATE (p:Post {id: c.value, author: $author, created_at: $created_at,
+                    content: $content, reply_count: 0})
+    FOREACH (i IN range(0, size($tags) - 1) |
+        MERGE (t:Tag {name: $tags[i]})
+        CREATE (p)-[:TAGGED {position: i}]->(t))
+    RETURN p.id AS id
+"""
+
+ADD_REPLY_QUERY = """
+    MATCH (p:Post {id: $post_id})
+    MERGE (c:Counter {name: 'reply'})
+    SET c.value = coalesce(c.value, 0) + 1
+    CREATE (:Reply {id: c.value, author: $author, created_at: $created_at,
+                    content: $content})-[:REPLY_TO]->(p)
+    SET p.reply_count = p.reply_count + 1
+    RETURN p.id AS post_id
+"""
+
+FEED_POSTS_QUERY = """
+    MATCH (p:Post)
+    CALL {
+        WITH p
+        OPTIONAL MATCH (p)-[tagged:TAGGED]->(t:Tag)
+        WITH t, tagged ORDER BY tagged.position
+        RETURN collect(t.name) AS tags
+    }
+    CALL {
+        WITH p
+        OPTIONAL MATCH (r:Reply)-[:REPLY_TO]->(p)
+        WITH r ORDER BY r.id
+        RETURN collect(r {.author, .created_at, .content}) AS replies
+    }
+    RETURN p.id AS id, p.author AS author, p.created_at AS created_at,
+           p.content AS content, tags, replies
+"""
+
+_LUCENE_SPECIAL = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+
+def text_hash(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
 
 class Neo4jHandler:
-    def __init__(self, uri="bolt://localhost:7687", user="neo4j", password="test"):
-        self.graph = Graph(uri, auth=(user, password))
-        print("[INFO] Connected to Neo4j.")
+    def __init__(self, uri=None, user=None, password=None, driver=None):
+        # Handlers are cheap: they all borrow the shared per-process pool
+        self.driver = driver or get_driver(uri, user, password)
+
+    def _query(self, query, **params):
+        records, _, _ = self.driver.execute_query(query, params)
+        return [record.data() for record in records]
+
+    def ensure_schema(self):
+        """Create the uniqueness constraints the ingest MERGEs rely on and the
+        full-text index used for answer retrieval.
+
+        Safe to call repeatedly. Returns the names of constraints and indexes
+        that did not exist before this call.
+        """
+        constraints = {r["name"] for r in self._query("SHOW CONSTRAINTS YIELD name")}
+        # Once the hash constraint exists every Answer has been keyed by hash
+        if "answer_hash_unique" not in constraints:
+            self._backfill_answer_hashes()
+        if not self._query("MATCH (m:SchemaMigration {name: $name}) RETURN m.name AS name",
+                           name=QUESTION_TEXT_MIGRATION):
+            self._normalize_question_texts()
+        created = []
+        for kind, existing, statements in (
+            ("constraint", constraints, SCHEMA_CONSTRAINTS),
+            ("index", {r["name"] for r in self._query("SHOW INDEXES YIELD name")}, SCHEMA_INDEXES),
+        ):
+            for name, statement in statements.items():
+                if name not in existing:
+                    self._query(statement)
+                    created.append(name)
+                    print(f"[INFO] Created {kind} {name}.")
+        return created
+
+    def _backfill_answer_hashes(self, batch_size=INGEST_BATCH_SIZE):
+        # Answer nodes written before answers were hash-keyed, one page at a
+        # time; each page drops out of the next page's WHERE once it is set
+        while True:
+            missing = self._query(
+                "MATCH (a:Answer) WHERE a.hash IS NULL RETURN id(a) AS id, a.text AS text LIMIT $limit",
+                limit=batch_size,
+            )
+            if not missing:
+                return
+            self._query("""
+                UNWIND $rows AS row
+                MATCH (a:Answer) WHERE id(a) = row.id
+                SET a.hash = row.hash
+            """, rows=[{"id": r["id"], "hash": text_hash(r["text"])} for r in missing])
+
+    def _normalize_question_texts(self, batch_size=INGEST_BATCH_SIZE):
+        # Question nodes written before questions were case-folded: fold them
+        # page by page, merging each into the node that already holds its
+        # folded text (if any) so the MERGE key stays unique.
+        after = -1
+        while True:
+            page = self._query(
+                "MATCH (q:Question) WHERE id(q) > $after "
+                "RETURN id(q) AS id, q.text AS text ORDER BY id(q) LIMIT $limit",
+                after=after, limit=batch_size,
+            )
+            if not page:
+                break
+            after = page[-1]["id"]
+            folded = ((r["id"], r["text"], normalize_question(r["text"])) for r in page)
+            legacy = [(node_id, text) for node_id, old, text in folded if text and text != old]
+            if not legacy:
+                continue
+            keepers = {r["text"]: r["id"] for r in self._query(
+                "UNWIND $texts AS text MATCH (q:Question {text: text}) RETURN q.text AS text, id(q) AS id",
+                texts=list({text for _, text in legacy}),
+            )}
+            merges, renames = [], []
+            for node_id, text in legacy:
+                if text in keepers:
+                    merges.append({"id": node_id, "keep": keepers[text]})
+                else:
+                    keepers[text] = node_id
+                    renames.append({"id": node_id, "text": text})
+            # Duplicates go first so the renames never collide with them
+            self.write_statements([(MERGE_QUESTIONS_QUERY, {"rows": merges}),
+                                   (RENAME_QUESTIONS_QUERY, {"rows": renames})])
+            print(f"[INFO] Normalized {len(renames)} questions, merged {len(merges)} duplicates.")
+        self._query("MERGE (:SchemaMigration {name: $name})", name=QUESTION_TEXT_MIGRATION)
 
     def add_question_answer(self, question, answer):
-        self.graph.run("""
-            MERGE (q:Question {text: $q_text})
-            MERGE (a:Answer {text: $a_text})
-            MERGE (q)-[:HAS_ANSWER]->(a)
-        """, q_text=question, a_text=answer)
+        self._query(ADD_QA_QUERY, q_text=question, a_text=answer, a_hash=text_hash(answer))
+
+    def find_answers(self, text, k=3):
+        """Return up to k {question, answer, score} dicts for stored questions
+        matching `text`, best first.
+        """
+        # Lower-casing also keeps AND/OR/NOT from being read as operators
+        terms = _LUCENE_SPECIAL.sub(r"\\\1", text.lower()).split()
+        if not terms:
+            return []
+        return self._query(FIND_ANSWERS_QUERY, query=" ".join(terms), k=k)
+
+    def find_similar_answers(self, text, index, k=3, min_score=0.0):
+        """Like find_answers, but matches `text` semantically against a
+        graph.vector_index.VectorIndex of Question texts.
+        """
+        hits = index.search([text], k=k, min_score=min_score)[0]
+        if not hits:
+            return []
+        scores = dict(hits)
+        rows = self._query(ANSWERS_FOR_QUESTIONS_QUERY, questions=list(scores))
+        for row in rows:
+            row["score"] = scores[row["question"]]
+        rows.sort(key=lambda row: row["score"], reverse=True)
+        return rows[:k]
+
+    def write_statements(self, statements, require_rows=False):
+        """Run (query, params) pairs in one write transaction and return each
+        statement's records as lists of dicts. With `require_rows`, a
+        statement that returns nothing (e.g. its MATCH found no node) raises
+        ValueError and rolls the whole transaction back.
+        """
+        with self.driver.session() as session:
+            return session.execute_write(self._run_statements, statements, require_rows)
+
+    @staticmethod
+    def _run_statements(tx, statements, require_rows):
+        results = []
+        for query, params in statements:
+            records = [record.data() for record in tx.run(query, params)]
+            if require_rows and not records:
+                raise ValueError(f"Write statement matched nothing: {params}")
+            results.append(records)
+        return results
+
+    def feed_posts(self):
+        """Every post with its tags and replies; the app sorts and filters in memory."""
+        return self._query(FEED_POSTS_QUERY)
+
+    def feed_version(self):
+        """(last post id, last reply id), from the id counters."""
+        rows = self._query("MATCH (c:Counter) RETURN c.name AS name, c.value AS value")
+        values = {r["name"]: r["value"] for r in rows}
+        return values.get("post", 0), values.get("reply", 0)
+
+    def add_question_answers(self, rows, batch_size=INGEST_BATCH_SIZE):
+        """Write (question, answer) pairs with one UNWIND statement per batch.
+
+        Each batch runs in its own explicit transaction. Returns the number
+        of rows written.
+        """
+        return self._run_batched("add", (ADD_QA_BATCH_QUERY,), rows, batch_size)
+
+    def remove_question_answers(self, rows, batch_size=INGEST_BATCH_SIZE):
+        """Delete the HAS_ANSWER edges for (question, answer) pairs, plus any
+        Question/Answer nodes left orphaned. Returns the number of rows processed.
+        """
+        return self._run_batched("remove", REMOVE_QA_BATCH_QUERIES, rows, batch_size)
+
+    def _run_batched(self, op, queries, rows, batch_size):
+        rows = iter(rows)
+        processed = 0
+        # One session per call, so concurrent callers each hold their own
+        with self.driver.session() as session:
+            while True:
+                batch = [
+                    {"q_text": q, "a_text": a, "a_hash": text_hash(a)}
+                    for q, a in islice(rows, batch_size)
+                ]
+                if not batch:
+                    break
+                attempts = []
+                started = time.perf_counter()
+                with metrics.timer("neo4j_batch_write_seconds", op=op):
+                    session.execute_write(self._write_batch, queries, batch, attempts, started)
+                metrics.incr("neo4j_rows_total", len(batch), op=op)
+                if len(attempts) > 1:
+                    metrics.incr("neo4j_retries_total", len(attempts) - 1, op=op)
+                processed += len(batch)
+        return processed
+
+    @staticmethod
+    def _write_batch(tx, queries, batch, attempts, started):
+        # The driver calls this once per attempt; the first call marks the
+        # wait for a pooled connection and an open transaction.
+        if not attempts:
+            metrics.observe("neo4j_acquire_seconds", time.perf_counter() - started)
+        attempts.append(time.perf_counter())
+        for query in queries:
+            tx.run(query, rows=batch).consume()
 
     def close(self):
-        # Not strictly required with py2neo but good for symmetry
-        print("[INFO] Connection closed (if applicable).")
+        # The pooled driver is shared and closed at process exit (graph.connection)
+        pass
@@ -0,0 +1,117 @@
+# graph/vector_index.py
+"""Memory-mapped hashing-vector index over Question texts.
+
+Questions are embedded with a CPU-only feature-hashing vectorizer (words,
+word bigrams and character trigrams) so paraphrases still land near each
+other. Vectors are L2-normalised float32 rows appended to `vectors.f32`;
+row i belongs to the Question whose text is line i of `keys.jsonl`. Question
+text is the node's MERGE key, so it doubles as the node-ID mapping.
+"""
+import json
+import os
+import re
+import zlib
+
+import numpy as np
+
+from config.settings import VECTOR_DIMS, VECTOR_INDEX_DIR
+
+_WORD = re.compile(r"\w+")
+
+# Rows scored per matrix product, to bound temporary memory on large indexes
+_SEARCH_BLOCK = 65536
+
+def _features(text):
+    words = _WORD.findall(text.casefold())
+    for word in words:
+        yield word
+        padded = f"#{word}#"
+        for i in range(len(padded) - 2):
+            yield padded[i:i + 3]
+    for first, second in zip(words, words[1:]):
+        yield f"{first} {second}"
+
+def vectorize(texts, dims=VECTOR_DIMS):
+    """Return a (len(texts), dims) float32 array of unit-length hashed vectors."""
+    out = np.zeros((len(texts), dims), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for feature in _features(text):
+            h = zlib.crc32(feature.encode("utf-8"))
+            out[row, h % dims] += 1.0 if h & 0x80000000 else -1.0
+    norms = np.linalg.norm(out, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    out /= norms
+    return out
+
+class VectorIndex:
+    def __init__(self, path=VECTOR_INDEX_DIR, dims=VECTOR_DIMS):
+        self.path = path
+        self.dims = dims
+        self.vectors_path = os.path.join(path, "vectors.f32")
+        self.keys_path = os.path.join(path, "keys.jsonl")
+        self._vectors = None
+        self._keys = None
+        self._known = None  # set(self._keys), for add()'s dedup
+
+    def exists(self):
+        return os.path.exists(self.vectors_path) and os.path.exists(self.keys_path)
+
+    def _load(self):
+        # Lazily mapped on first search so opening the index costs nothing
+        if self._keys is None:
+            self._keys = []
+            if self.exists():
+                with open(self.keys_path, encoding="utf-8") as f:
+                    self._keys = [json.loads(line) for line in f]
+            self._known = set(self._keys)
+        if self._vectors is None and self._keys:
+            self._vectors = np.memmap(
+                self.vectors_path, dtype=np.float32, mode="r", shape=(len(self._keys), self.dims)
+            )
+
+    def __len__(self):
+        self._load()
+        return len(self._keys)
+
+    def add(self, texts):
+        """Append vectors for texts not already indexed. Returns how many were added."""
+        self._load()
+        new = list(dict.fromkeys(text for text in texts if text not in self._known))
+        if not new:
+            return 0
+        os.makedirs(self.path, exist_ok=True)
+        with open(self.vectors_path, "ab") as f:
+            f.write(vectorize(new, self.dims).tobytes())
+        with open(self.keys_path, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(text) + "\n" for text in new)
+        self._keys.extend(new)
+        self._known.update(new)
+        self._vectors = None  # remap with the new length on next search
+        return len(new)
+
+    def search(self, texts, k=3, min_score=0.0):
+        """Top-k cosine matches for each query text, as lists of (key, score)."""
+        self._load()
+        if not texts:
+            return []
+        if self._vectors is None:
+            return [[] for _ in texts]
+        queries = vectorize(texts, self.dims).T
+        n = len(self._keys)
+        best_scores = np.full((len(texts), 0), -np.inf, dtype=np.float32)
+        best_rows = np.zeros((len(texts), 0), dtype=np.int64)
+        for start in range(0, n, _SEARCH_BLOCK):
+            block = (self._vectors[start:start + _SEARCH_BLOCK] @ queries).T
+            block_rows = np.broadcast_to(np.arange(start, start + block.shape[1]), block.shape)
+            scores = np.concatenate([best_scores, block], axis=1)
+            rows = np.concatenate([best_rows, block_rows], axis=1)
+            top = np.argpartition(-scores, min(k, scores.shape[1]) - 1, axis=1)[:, :k]
+            best_scores = np.take_along_axis(scores, top, axis=1)
+            best_rows = np.take_along_axis(rows, top, axis=1)
+        order = np.argsort(-best_scores, axis=1)
+        best_scores = np.take_along_axis(best_scores, order, axis=1)
+        best_rows = np.take_along_axis(best_rows, order, axis=1)
+        return [
+            [(self._keys[r], float(s)) for r, s in zip(row_ids, row_scores) if s >= min_score]
+            for row_ids, row_scores in zip(best_rows, best_scores)
+        ]
@@ -0,0 +1,131 @@
+# ingest/batch_writer.py
+"""Batch writes with retry on transient errors and poison-row quarantine."""
+import json
+import os
+import random
+import threading
+import time
+
+from config.settings import (
+    INGEST_MAX_REJECT_RATIO, INGEST_MAX_RETRIES, INGEST_RETRY_BASE_DELAY, INGEST_RETRY_MAX_DELAY,
+)
+from telemetry import metrics
+
+# Client error classes that say nothing about the rows themselves: bad
+# credentials or permissions, a missing or read-only database, a closed
+# transaction. Quarantining rows for these would empty the whole file.
+_SYSTEMIC_CLIENT_ERRORS = {"Security", "Database", "Transaction"}
+# The reject ratio is only meaningful once a few batches have gone through
+_REJECT_RATIO_MIN_ROWS = 1000
+
+class RejectLimitExceeded(RuntimeError):
+    """Too many rows were refused for this to be a few bad rows."""
+
+def default_reject_path(filepath):
+    return f"{filepath}.rejects.jsonl"
+
+def is_transient(exc):
+    """True for errors worth retrying: the driver's retryable errors
+    (deadlocks, leader switches, dropped connections) and socket-level ones.
+    """
+    is_retryable = getattr(exc, "is_retryable", None)
+    if callable(is_retryable) and is_retryable():
+        return True
+    return isinstance(exc, (ConnectionError, TimeoutError))
+
+def is_row_error(exc):
+    """True if the database refused the data itself (a Neo.ClientError code
+    outside the systemic classes), so other rows may still succeed.
+    """
+    parts = str(getattr(exc, "code", None) or "").split(".")
+    return (len(parts) == 4 and parts[1] == "ClientError"
+            and parts[2] not in _SYSTEMIC_CLIENT_ERRORS)
+
+def call_with_retry(fn, retries=INGEST_MAX_RETRIES, base_delay=INGEST_RETRY_BASE_DELAY,
+                    max_delay=INGEST_RETRY_MAX_DELAY):
+    """Call fn(), retrying transient failures with exponential backoff and full jitter."""
+    for attempt in range(retries + 1):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == retries or not is_transient(e):
+                raise
+            delay = random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+            metrics.incr("ingest_retries_total")
+            print(f"[WARN] Transient error ({e.__class__.__name__}), retry {attempt + 1}/{retries} in {delay:.1f}s.")
+            time.sleep(delay)
+
+class BatchWriter:
+    """Writes numbered batches through a handler.
+
+    Batches already in the checkpoint are skipped. A batch the database
+    refuses because of its data (see is_row_error) is split in half and
+    retried until the offending rows are isolated; those go to the reject file
+    instead of aborting the run. Any other error aborts the run with the
+    checkpoint intact, as does a batch whose every row is refused or a reject
+    share above `max_reject_ratio`. Safe to call from several pipeline writer
+    threads.
+
+    The reject file starts empty unless `resume` is set, in which case it
+    keeps the rejects of the run being resumed.
+    """
+
+    def __init__(self, handler, checkpoint=None, reject_path=None,
+                 max_reject_ratio=INGEST_MAX_REJECT_RATIO, resume=False):
+        self.handler = handler
+        self.checkpoint = checkpoint
+        self.reject_path = reject_path
+        self.max_reject_ratio = max_reject_ratio
+        self.skipped_batches = 0
+        self.attempted = 0
+        self.rejected = 0
+        # Every row refused so far, including by an earlier run being resumed,
+        # so the caller can leave them out of the delta manifest
+        self.rejected_rows = list(checkpoint.rejected) if checkpoint else []
+        self._lock = threading.Lock()
+        if reject_path and not resume and os.path.exists(reject_path):
+            os.remove(reject_path)
+
+    def write(self, seq, batch):
+        if self.checkpoint and self.checkpoint.is_committed(seq):
+            with self._lock:
+                self.skipped_batches += 1
+            return 0
+        rejects = []
+        written = self._write_or_split(batch, rejects)
+        if len(batch) > 1 and len(rejects) == len(batch):
+            raise RejectLimitExceeded(f"Every row of batch {seq} was refused, last error: {rejects[-1][1]}")
+        with self._lock:
+            self.attempted += len(batch)
+            self.rejected += len(rejects)
+            if (self.attempted >= _REJECT_RATIO_MIN_ROWS
+                    and self.rejected > self.max_reject_ratio * self.attempted):
+                raise RejectLimitExceeded(
+                    f"{self.rejected} of {self.attempted} rows refused, above the "
+                    f"{self.max_reject_ratio:.0%} limit"
+                )
+            if rejects:
+                self._save_rejects(rejects)
+                self.rejected_rows.extend(row for row, _ in rejects)
+        if self.checkpoint:
+            self.checkpoint.mark(seq, [row for row, _ in rejects])
+        return written
+
+    def _write_or_split(self, batch, rejects):
+        try:
+            return call_with_retry(lambda: self.handler.add_question_answers(batch, batch_size=len(batch)))
+        except Exception as e:
+            if self.reject_path is None or not is_row_error(e):
+                raise  # transient and out of retries, or systemic: let --resume pick it up
+            if len(batch) == 1:
+                rejects.append((batch[0], e))
+                return 0
+            mid = len(batch) // 2
+            return self._write_or_split(batch[:mid], rejects) + self._write_or_split(batch[mid:], rejects)
+
+    def _save_rejects(self, rejects):
+        # Only for batches that are kept, so an aborted batch is not listed twice on resume
+        metrics.incr("ingest_rows_rejected_total", len(rejects))
+        with open(self.reject_path, "a", encoding="utf-8") as f:
+            for (question, answer), error in rejects:
+                f.write(json.dumps({"question": question, "answer": answer, "error": str(error)}) + "\n")
@@ -0,0 +1,126 @@
+# ingest/bulk_export.py
+"""Turn Q&A source files into node and relationship CSVs for the offline
+`neo4j-admin database import`, for first-time loads too large for Cypher.
+
+Rows are normalized and deduplicated exactly as in excel_ingest, and IDs are
+content hashes, so the same input always produces the same files and the
+resulting graph matches what the online path would have MERGEd:
+
+    questions.csv   :ID(Question) = sha1 of the normalized question, text
+    answers.csv     hash:ID(Answer) = sha1 of the normalized answer, text
+    has_answer.csv  (Question)-[:HAS_ANSWER]->(Answer)
+
+Each source's delta manifest (<file>.manifest.sqlite) is seeded with its
+pairs, so a later `excel_ingest --delta` only sends what changed since the
+export. Output is streamed; only 64-bit keys of the nodes already written are
+kept in memory.
+"""
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import argparse
+import csv
+import time
+
+from config.settings import INGEST_CHUNK_SIZE
+from graph.neo4j_handler import text_hash
+from ingest.manifest import IngestManifest, default_manifest_path
+from ingest.normalize import RowNormalizer
+from ingest.readers import iter_qa_rows
+from telemetry.progress import Progress
+
+QUESTIONS_FILE = "questions.csv"
+ANSWERS_FILE = "answers.csv"
+RELATIONSHIPS_FILE = "has_answer.csv"
+
+def _key(digest):
+    return int(digest[:16], 16)
+
+def write_import_csvs(rows, out_dir):
+    """Write normalized (question, answer) pairs as import CSVs under `out_dir`.
+
+    Returns a dict with the number of questions, answers and relationships written.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    seen_questions, seen_answers = set(), set()
+    counts = {"questions": 0, "answers": 0, "relationships": 0}
+    with open(os.path.join(out_dir, QUESTIONS_FILE), "w", newline="", encoding="utf-8") as qf, \
+            open(os.path.join(out_dir, ANSWERS_FILE), "w", newline="", encoding="utf-8") as af, \
+            open(os.path.join(out_dir, RELATIONSHIPS_FILE), "w", newline="", encoding="utf-8") as rf:
+        questions, answers, relationships = csv.writer(qf), csv.writer(af), csv.writer(rf)
+        questions.writerow([":ID(Question)", "text", ":LABEL"])
+        answers.writerow(["hash:ID(Answer)", "text", ":LABEL"])
+        relationships.writerow([":START_ID(Question)", ":END_ID(Answer)", ":TYPE"])
+        for question, answer in rows:
+            q_id, a_id = text_hash(question), text_hash(answer)
+            if _key(q_id) not in seen_questions:
+                seen_questions.add(_key(q_id))
+                questions.writerow([q_id, question, "Question"])
+                counts["questions"] += 1
+            if _key(a_id) not in seen_answers:
+                seen_answers.add(_key(a_id))
+                answers.writerow([a_id, answer, "Answer"])
+                counts["answers"] += 1
+            relationships.writerow([q_id, a_id, "HAS_ANSWER"])
+            counts["relationships"] += 1
+    return counts
+
+def import_command(out_dir, database="neo4j"):
+    path = os.path.abspath(out_dir)
+    return (
+        "neo4j-admin database import full "
+        f"--nodes={os.path.join(path, QUESTIONS_FILE)} "
+        f"--nodes={os.path.join(path, ANSWERS_FILE)} "
+        f"--relationships={os.path.join(path, RELATIONSHIPS_FILE)} {database}"
+    )
+
+def export_for_bulk_import(filepaths, out_dir, chunk_size=INGEST_CHUNK_SIZE, progress=False,
+                           seed_manifests=True):
+    print("[INFO] Streaming rows from source files...")
+    started = time.perf_counter()
+    normalizers = [RowNormalizer() for _ in filepaths]
+    manifests = [IngestManifest(default_manifest_path(path)) for path in filepaths] if seed_manifests else []
+
+    def rows():
+        # Normalized per file, so each manifest gets all of its file's pairs
+        # even when another file already supplied some of them
+        for i, path in enumerate(filepaths):
+            file_rows = normalizers[i].process(iter_qa_rows(path, chunk_size=chunk_size))
+            if manifests:
+                file_rows = manifests[i].record(file_rows)
+            yield from file_rows
+
+    pairs = rows()
+    if progress:
+        pairs = Progress().track(pairs)
+    # Drops pairs repeated across files; rows are already normalized
+    across_files = RowNormalizer()
+    counts = write_import_csvs(across_files.process(pairs), out_dir)
+    for manifest in manifests:
+        manifest.commit()
+        manifest.close()
+    elapsed = time.perf_counter() - started
+    removed = sum(n.removed for n in normalizers) + across_files.removed
+    print(f"[INFO] Normalization removed {removed} duplicate or empty rows.")
+    print(f"[INFO] Wrote {counts['questions']} questions, {counts['answers']} answers and "
+          f"{counts['relationships']} relationships to {out_dir} in {elapsed:.1f}s.")
+    print("[INFO] Load them into a stopped, empty database with:")
+    print(f"  {import_command(out_dir)}")
+    print("[INFO] Then start the database and run Neo4jHandler().ensure_schema() "
+          "to create the constraints and indexes.")
+    if manifests:
+        print(f"[INFO] Seeded delta manifests: {', '.join(m.path for m in manifests)}.")
+    return counts
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate neo4j-admin import CSVs from Q&A sheets.")
+    parser.add_argument("filepaths", nargs="+")
+    parser.add_argument("--out", default="import", help="output directory for the CSVs")
+    parser.add_argument("--progress", action="store_true",
+                        help="show a progress line with rate on stderr")
+    parser.add_argument("--no-manifest", action="store_true",
+                        help="don't seed <filepath>.manifest.sqlite for later --delta runs")
+    args = parser.parse_args()
+    export_for_bulk_import(args.filepaths, args.out, progress=args.progress,
+                           seed_manifests=not args.no_manifest)
@@ -0,0 +1,64 @@
+# ingest/checkpoint.py
+"""Local record of committed batches so an interrupted ingest can resume."""
+import json
+import os
+import threading
+
+def default_checkpoint_path(filepath):
+    return f"{filepath}.checkpoint.json"
+
+def _fingerprint(filepath):
+    stat = os.stat(filepath)
+    return {"source": os.path.abspath(filepath), "size": stat.st_size, "mtime": stat.st_mtime}
+
+class IngestCheckpoint:
+    """Tracks committed batch numbers as a low-water mark plus the set of
+    later batches that finished out of order (parallel writers).
+
+    `params` (batch size, worker count, ...) must match on resume, since they
+    decide how rows are grouped into numbered batches.
+    """
+
+    def __init__(self, path, filepath, params, resume=False):
+        self.path = path
+        self.header = dict(_fingerprint(filepath), params=params)
+        self.committed_below = 0
+        self.committed = set()
+        self.rejected = []
+        self._lock = threading.Lock()
+        if resume and os.path.exists(path):
+            with open(path) as f:
+                saved = json.load(f)
+            if {k: saved.get(k) for k in self.header} != self.header:
+                raise ValueError(
+                    f"Checkpoint {path} was written for a different file or settings; "
+                    "rerun without --resume to start over"
+                )
+            self.committed_below = saved["committed_below"]
+            self.committed = set(saved["committed"])
+            self.rejected = [tuple(row) for row in saved["rejected"]]
+
+    def is_committed(self, seq):
+        with self._lock:
+            return seq < self.committed_below or seq in self.committed
+
+    def mark(self, seq, rejected=()):
+        """Record batch `seq` as written, except for the `rejected` rows."""
+        with self._lock:
+            self.committed.add(seq)
+            self.rejected.extend(rejected)
+            while self.committed_below in self.committed:
+                self.committed.remove(self.committed_below)
+                self.committed_below += 1
+            state = dict(self.header, committed_below=self.committed_below, committed=sorted(self.committed),
+                         rejected=self.rejected)
+            # Write-then-rename so a crash never leaves a torn checkpoint
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp, self.path)
+
+    def completed(self):
+        """Remove the checkpoint once the whole file has been ingested."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
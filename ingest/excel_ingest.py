@@ -3,29 +3,141 @@ import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-import pandas as pd
+import argparse
+import time
+from itertools import islice
+
+from config.settings import INGEST_BATCH_SIZE, INGEST_CHUNK_SIZE, INGEST_WORKERS, VECTOR_INDEX_DIR
 from graph.neo4j_handler import Neo4jHandler
+from ingest.batch_writer import BatchWriter, default_reject_path
+from ingest.checkpoint import IngestCheckpoint, default_checkpoint_path
+from ingest.manifest import IngestManifest, default_manifest_path
+from ingest.normalize import RowNormalizer
+from ingest.pipeline import run_pipeline
+from ingest.readers import estimate_rows, iter_qa_rows
+from telemetry import metrics
+from telemetry.progress import Progress
+
+def _embed_questions(rows, index, batch_size):
+    # Pass rows through while appending their questions to the vector index
+    pending = []
+    for question, answer in rows:
+        pending.append(question)
+        if len(pending) >= batch_size:
+            index.add(pending)
+            pending = []
+        yield question, answer
+    index.add(pending)
+
+def _numbered_batches(rows, batch_size):
+    rows = iter(rows)
+    seq = 0
+    while batch := list(islice(rows, batch_size)):
+        yield seq, batch
+        seq += 1
+
+def ingest_excel_to_neo4j(filepath, batch_size=INGEST_BATCH_SIZE, chunk_size=INGEST_CHUNK_SIZE,
+                          workers=INGEST_WORKERS, delta=False, retract=False, manifest_path=None,
+                          embed=False, index_path=VECTOR_INDEX_DIR, handler=None, progress=False,
+                          resume=False, checkpoint_path=None, reject_path=None):
+    print("[INFO] Streaming rows from source file...")
+    started = time.perf_counter()
+    rows = iter_qa_rows(filepath, chunk_size=chunk_size)
+    if progress:
+        rows = Progress(estimate_rows(filepath)).track(rows)
+
+    normalizer = RowNormalizer()
+    manifest = None
+    if delta:
+        manifest = IngestManifest(manifest_path or default_manifest_path(filepath))
+        print(f"[INFO] Delta mode: only pairs missing from {manifest.path} will be written.")
+
+    index = None
+    if embed:
+        from graph.vector_index import VectorIndex
+        index = VectorIndex(index_path)
 
-def ingest_excel_to_neo4j(filepath):
-    print("[INFO] Loading Excel data...")
-    df = pd.read_excel(filepath)
+    def prepare(rows):
+        rows = normalizer.process(rows)
+        if manifest:
+            rows = manifest.filter_new(rows)
+        if index is not None:
+            rows = _embed_questions(rows, index, batch_size)
+        return rows
 
-    df.columns = [col.strip().lower() for col in df.columns]
-    if 'questiontext' not in df or 'answertext' not in df:
-        raise ValueError("Excel must have 'questionText' and 'answerText' columns")
+    # Any object with the Neo4jHandler ingest interface, e.g. InMemoryGraphHandler
+    handler = handler or Neo4jHandler()
+    handler.ensure_schema()
 
-    print(f"[INFO] Loaded {len(df)} rows from Excel.")
+    checkpoint = IngestCheckpoint(checkpoint_path or default_checkpoint_path(filepath), filepath,
+                                  {"batch_size": batch_size, "workers": workers, "delta": delta},
+                                  resume=resume)
+    if checkpoint.committed_below or checkpoint.committed:
+        print(f"[INFO] Resuming from {checkpoint.path}: batches below "
+              f"{checkpoint.committed_below} are already written.")
+    writer = BatchWriter(handler, checkpoint, reject_path or default_reject_path(filepath), resume=resume)
 
-    handler = Neo4jHandler()
+    if workers > 1:
+        written = run_pipeline(rows, writer.write, workers=workers, batch_size=batch_size, prepare=prepare)
+    else:
+        written = sum(writer.write(seq, batch) for seq, batch in _numbered_batches(prepare(rows), batch_size))
+    checkpoint.completed()
+    elapsed = time.perf_counter() - started
+    print(f"[INFO] Normalization removed {normalizer.removed} duplicate or empty rows.")
+    print(f"[INFO] Wrote {written} rows in batches of {batch_size} using {workers} writer(s) "
+          f"in {elapsed:.1f}s ({normalizer.processed / elapsed:,.0f} rows/s read).")
+    metrics.observe("ingest_seconds", elapsed)
+    metrics.incr("ingest_rows_read_total", normalizer.processed)
+    metrics.incr("ingest_rows_removed_total", normalizer.removed)
+    metrics.incr("ingest_rows_written_total", written)
+    if writer.skipped_batches:
+        print(f"[INFO] Skipped {writer.skipped_batches} batches committed by an earlier run.")
+    if writer.rejected_rows:
+        # Includes rejects from the run being resumed, to match the file
+        print(f"[WARN] Rejected {len(writer.rejected_rows)} rows; see {writer.reject_path}.")
+    if index is not None:
+        print(f"[INFO] Vector index at {index.path} now holds {len(index)} questions.")
 
-    for _, row in df.iterrows():
-        question = str(row['questiontext']).strip()
-        answer = str(row['answertext']).strip()
-        if question and answer:
-            handler.add_question_answer(question, answer)
+    if manifest:
+        manifest.commit(exclude=writer.rejected_rows)
+        if retract:
+            stale = manifest.stale()
+            removed = handler.remove_question_answers(stale, batch_size=batch_size)
+            manifest.forget(stale)
+            print(f"[INFO] Retracted {removed} pairs no longer in the source.")
+        manifest.close()
 
     handler.close()
+    metrics.flush()
     print("✅ Ingestion complete.")
+    return written
 
 if __name__ == "__main__":
-    ingest_excel_to_neo4j("/Users/varuncwx/Desktop/hackathon/data/qa.xlsx")
+    parser = argparse.ArgumentParser(description="Ingest a Q&A sheet into Neo4j.")
+    parser.add_argument("filepath", nargs="?", default="/Users/varuncwx/Desktop/hackathon/data/qa.xlsx")
+    parser.add_argument("--batch-size", type=int, default=INGEST_BATCH_SIZE)
+    parser.add_argument("--workers", type=int, default=INGEST_WORKERS,
+                        help="number of concurrent graph writers")
+    parser.add_argument("--delta", action="store_true",
+                        help="skip pairs already recorded in the local manifest")
+    parser.add_argument("--retract", action="store_true",
+                        help="with --delta, remove pairs that are no longer in the source")
+    parser.add_argument("--manifest", default=None,
+                        help="manifest path (default: <filepath>.manifest.sqlite)")
+    parser.add_argument("--embed", action="store_true",
+                        help="append ingested questions to the local vector index")
+    parser.add_argument("--progress", action="store_true",
+                        help="show a progress bar with rate and ETA on stderr")
+    parser.add_argument("--resume", action="store_true",
+                        help="skip batches recorded in the checkpoint of an interrupted run")
+    parser.add_argument("--checkpoint", default=None,
+                        help="checkpoint path (default: <filepath>.checkpoint.json)")
+    parser.add_argument("--rejects", default=None,
+                        help="file for rows the database refuses (default: <filepath>.rejects.jsonl)")
+    args = parser.parse_args()
+    if args.retract and not args.delta:
+        parser.error("--retract requires --delta")
+    ingest_excel_to_neo4j(args.filepath, batch_size=args.batch_size, workers=args.workers,
+                          delta=args.delta, retract=args.retract, manifest_path=args.manifest,
+                          embed=args.embed, progress=args.progress, resume=args.resume,
+                          checkpoint_path=args.checkpoint, reject_path=args.rejects)
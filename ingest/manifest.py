@@ -0,0 +1,101 @@
+# ingest/manifest.py
+"""Local SQLite manifest of pairs already ingested, for delta re-ingests.
+
+Each (question, answer) pair is keyed by a content hash. On rerun only pairs
+missing from the manifest are sent to the graph, and pairs that disappeared
+from the source can be listed for retraction.
+"""
+import hashlib
+import sqlite3
+from itertools import islice
+
+# Stay under SQLite's bound-parameter limit on older builds
+_LOOKUP_CHUNK = 500
+
+def pair_hash(question, answer):
+    return hashlib.sha1(f"{question}\x1f{answer}".encode("utf-8")).hexdigest()
+
+def default_manifest_path(filepath):
+    return f"{filepath}.manifest.sqlite"
+
+class IngestManifest:
+    def __init__(self, path):
+        self.path = path
+        # filter_new() may run on a pipeline stage thread; use is never concurrent
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS pairs (
+                hash TEXT PRIMARY KEY,
+                question TEXT NOT NULL,
+                answer TEXT NOT NULL
+            );
+            CREATE TEMP TABLE seen (hash TEXT PRIMARY KEY);
+            CREATE TEMP TABLE pending (
+                hash TEXT PRIMARY KEY,
+                question TEXT NOT NULL,
+                answer TEXT NOT NULL
+            );
+        """)
+
+    def _existing(self, table, hashes):
+        placeholders = ",".join("?" * len(hashes))
+        cur = self.conn.execute(f"SELECT hash FROM {table} WHERE hash IN ({placeholders})", hashes)
+        return {row[0] for row in cur}
+
+    def filter_new(self, rows):
+        """Yield only pairs not already in the manifest (or earlier in this run)."""
+        rows = iter(rows)
+        while True:
+            chunk = {pair_hash(q, a): (q, a) for q, a in islice(rows, _LOOKUP_CHUNK)}
+            if not chunk:
+                break
+            hashes = list(chunk)
+            known = self._existing("seen", hashes) | self._existing("pairs", hashes)
+            self.conn.executemany("INSERT OR IGNORE INTO seen VALUES (?)", ((h,) for h in hashes))
+            new = [(h, *chunk[h]) for h in hashes if h not in known]
+            self.conn.executemany("INSERT INTO pending VALUES (?, ?, ?)", new)
+            for _, question, answer in new:
+                yield question, answer
+
+    def record(self, rows):
+        """Pass pairs through unfiltered, queueing them for commit() as
+        already in the graph (e.g. loaded by an offline bulk import).
+        """
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, _LOOKUP_CHUNK))
+            if not chunk:
+                break
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO pending VALUES (?, ?, ?)",
+                ((pair_hash(q, a), q, a) for q, a in chunk),
+            )
+            yield from chunk
+
+    def commit(self, exclude=()):
+        """Record this run's new pairs once they are safely in the graph,
+        except the `exclude` pairs (rows the graph refused), so the next delta
+        run tries them again.
+        """
+        with self.conn:
+            self.conn.executemany(
+                "DELETE FROM pending WHERE hash = ?", ((pair_hash(q, a),) for q, a in exclude)
+            )
+            self.conn.execute("INSERT OR IGNORE INTO pairs SELECT hash, question, answer FROM pending")
+            self.conn.execute("DELETE FROM pending")
+
+    def stale(self):
+        """Pairs in the manifest that were not seen in this run's source."""
+        cur = self.conn.execute(
+            "SELECT question, answer FROM pairs WHERE hash NOT IN (SELECT hash FROM seen)"
+        )
+        return cur.fetchall()
+
+    def forget(self, rows):
+        with self.conn:
+            self.conn.executemany(
+                "DELETE FROM pairs WHERE hash = ?", ((pair_hash(q, a),) for q, a in rows)
+            )
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,45 @@
+# ingest/normalize.py
+"""Text normalization and in-memory pair dedup, applied before graph writes."""
+import hashlib
+import unicodedata
+
+def normalize_answer(text):
+    """Unicode-fold (NFKC) and collapse runs of whitespace."""
+    return " ".join(unicodedata.normalize("NFKC", str(text)).split())
+
+def normalize_question(text):
+    """Like normalize_answer, but also case-folded: questions are MERGE keys,
+    so "How do I sleep?" and "how do i  sleep?" must land on the same node.
+    """
+    return normalize_answer(text).casefold()
+
+def _pair_key(question, answer):
+    # 64-bit digest instead of the strings themselves keeps the seen-set small
+    # on very large inputs; collisions are negligible below billions of rows.
+    digest = hashlib.blake2b(f"{question}\x1f{answer.casefold()}".encode("utf-8"), digest_size=8)
+    return int.from_bytes(digest.digest(), "little")
+
+class RowNormalizer:
+    def __init__(self):
+        self.seen = set()
+        self.processed = 0
+        self.removed = 0
+
+    def process(self, rows):
+        """Yield normalized (question, answer) pairs, dropping duplicates and
+        pairs that are empty after normalization. Counts rows seen in
+        `processed` and drops in `removed`.
+        """
+        for question, answer in rows:
+            self.processed += 1
+            question = normalize_question(question)
+            answer = normalize_answer(answer)
+            if not question or not answer:
+                self.removed += 1
+                continue
+            key = _pair_key(question, answer)
+            if key in self.seen:
+                self.removed += 1
+                continue
+            self.seen.add(key)
+            yield question, answer
@@ -0,0 +1,139 @@
+# ingest/pipeline.py
+"""Concurrent ingest pipeline: reader -> prepare (normalize/dedup) -> N graph writers.
+
+Stages are connected by bounded queues so a slow database applies
+backpressure all the way back to the file reader. Writers share one
+Neo4jHandler (and so one pooled driver); each writer runs in its own session.
+
+Batches are numbered in the order the prepare stage emits them, which is
+deterministic for a given input, so a checkpoint of committed batch numbers
+stays valid when the same file is re-run.
+
+Rows are partitioned across writers by a hash of the answer text, so two
+writers never MERGE the same Answer node concurrently. Rows sharing a question
+(one question often has several answers) can still land on different writers
+and contend for the same Question node. Each batch is therefore sorted by
+question text, so every transaction takes Question locks in the same order:
+writers may wait on each other, but they do not deadlock on Question nodes.
+"""
+import queue
+import threading
+from itertools import islice
+
+from config.settings import INGEST_BATCH_SIZE, INGEST_QUEUE_SIZE, INGEST_WORKERS
+from graph.neo4j_handler import text_hash
+
+_DONE = object()
+
+class _Aborted(Exception):
+    """Raised inside a stage when another stage has failed."""
+
+def _put(q, item, stop):
+    while True:
+        if stop.is_set():
+            raise _Aborted()
+        try:
+            q.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+
+def _chunks(q, stop):
+    while True:
+        if stop.is_set():
+            raise _Aborted()
+        try:
+            chunk = q.get(timeout=0.1)
+        except queue.Empty:
+            continue
+        if chunk is _DONE:
+            return
+        yield chunk
+
+def partition_for(answer, partitions):
+    return int(text_hash(answer)[:8], 16) % partitions
+
+def run_pipeline(rows, write_batch, workers=INGEST_WORKERS, batch_size=INGEST_BATCH_SIZE,
+                 queue_size=INGEST_QUEUE_SIZE, prepare=None):
+    """Write (question, answer) pairs through `workers` concurrent writers.
+
+    `write_batch(seq, batch)` writes one numbered batch and returns the rows
+    written, e.g. ingest.batch_writer.BatchWriter.write. `prepare` is an
+    optional generator function (rows -> rows) run on its own stage between
+    the reader and the writers, e.g. RowNormalizer.process.
+    Returns the number of rows written. Re-raises the first error any stage hit.
+    """
+    stop = threading.Event()
+    errors = []
+    raw = queue.Queue(maxsize=queue_size)
+    partitions = [queue.Queue(maxsize=queue_size) for _ in range(workers)]
+    written = [0] * workers
+
+    def guarded(fn):
+        def run(*args):
+            try:
+                fn(*args)
+            except _Aborted:
+                pass
+            except BaseException as e:
+                errors.append(e)
+                stop.set()
+        return run
+
+    def read():
+        it = iter(rows)
+        while True:
+            chunk = list(islice(it, batch_size))
+            if not chunk:
+                break
+            _put(raw, chunk, stop)
+        _put(raw, _DONE, stop)
+
+    def normalize():
+        buffers = [[] for _ in range(workers)]
+        seq = 0
+        prepared = (row for chunk in _chunks(raw, stop) for row in chunk)
+        if prepare:
+            prepared = prepare(prepared)
+        for question, answer in prepared:
+            p = partition_for(answer, workers)
+            buffers[p].append((question, answer))
+            if len(buffers[p]) >= batch_size:
+                buffers[p].sort()
+                _put(partitions[p], (seq, buffers[p]), stop)
+                seq += 1
+                buffers[p] = []
+        for p, buffer in enumerate(buffers):
+            if buffer:
+                buffer.sort()
+                _put(partitions[p], (seq, buffer), stop)
+                seq += 1
+            _put(partitions[p], _DONE, stop)
+
+    def write(i):
+        for seq, batch in _chunks(partitions[i], stop):
+            written[i] += write_batch(seq, batch)
+
+    threads = [
+        threading.Thread(target=guarded(read), name="ingest-reader"),
+        threading.Thread(target=guarded(normalize), name="ingest-normalize"),
+    ] + [
+        threading.Thread(target=guarded(write), args=(i,), name=f"ingest-writer-{i}")
+        for i in range(workers)
+    ]
+    for t in threads:
+        t.start()
+    try:
+        for t in threads:
+            t.join()
+    except BaseException:
+        # Ctrl-C lands here: stop every stage at its next queue poll; the
+        # batch a writer is in the middle of still completes
+        stop.set()
+        for t in threads:
+            t.join()
+        raise
+
+    if errors:
+        raise errors[0]
+    return sum(written)
@@ -0,0 +1,110 @@
+# ingest/readers.py
+"""Streaming readers that yield (question, answer) pairs from source files.
+
+Rows are read chunk by chunk so memory stays bounded regardless of file size.
+"""
+import math
+import os
+
+from config.settings import INGEST_CHUNK_SIZE
+from telemetry import metrics
+
+QUESTION_COLUMN = "questiontext"
+ANSWER_COLUMN = "answertext"
+
+def _normalize_column(name):
+    return str(name).strip().lower()
+
+def _clean(value):
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    return str(value).strip()
+
+def _require_columns(columns):
+    columns = [_normalize_column(c) for c in columns]
+    if QUESTION_COLUMN not in columns or ANSWER_COLUMN not in columns:
+        raise ValueError("Input must have 'questionText' and 'answerText' columns")
+    return columns.index(QUESTION_COLUMN), columns.index(ANSWER_COLUMN)
+
+def _pairs(questions, answers):
+    for question, answer in zip(questions, answers):
+        question = _clean(question)
+        answer = _clean(answer)
+        if question and answer:
+            yield question, answer
+
+def _iter_xlsx(filepath):
+    from openpyxl import load_workbook
+
+    with metrics.timer("ingest_file_open_seconds", format="xlsx"):
+        wb = load_workbook(filepath, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            raise ValueError("Input must have 'questionText' and 'answerText' columns")
+        q_idx, a_idx = _require_columns(header)
+        for row in rows:
+            if len(row) <= max(q_idx, a_idx):
+                continue
+            yield from _pairs((row[q_idx],), (row[a_idx],))
+    finally:
+        wb.close()
+
+def _iter_csv(filepath, chunk_size):
+    import pandas as pd
+
+    wanted = {QUESTION_COLUMN, ANSWER_COLUMN}
+    chunks = pd.read_csv(
+        filepath,
+        usecols=lambda c: _normalize_column(c) in wanted,
+        dtype=str,
+        chunksize=chunk_size,
+    )
+    for chunk in chunks:
+        metrics.incr("ingest_chunks_read_total", format="csv")
+        q_idx, a_idx = _require_columns(chunk.columns)
+        yield from _pairs(chunk.iloc[:, q_idx], chunk.iloc[:, a_idx])
+
+def _iter_parquet(filepath, chunk_size):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Reading Parquet files requires pyarrow (pip install pyarrow)") from e
+
+    pf = pq.ParquetFile(filepath)
+    names = pf.schema_arrow.names
+    q_idx, a_idx = _require_columns(names)
+    columns = [names[q_idx], names[a_idx]]
+    for batch in pf.iter_batches(batch_size=chunk_size, columns=columns):
+        metrics.incr("ingest_chunks_read_total", format="parquet")
+        yield from _pairs(batch.column(0).to_pylist(), batch.column(1).to_pylist())
+
+def iter_qa_rows(filepath, chunk_size=INGEST_CHUNK_SIZE):
+    """Yield cleaned, non-empty (question, answer) pairs from an .xlsx, .csv or .parquet file."""
+    ext = os.path.splitext(filepath)[1].lower()
+    if ext in (".xlsx", ".xlsm"):
+        return _iter_xlsx(filepath)
+    if ext == ".csv":
+        return _iter_csv(filepath, chunk_size)
+    if ext == ".parquet":
+        return _iter_parquet(filepath, chunk_size)
+    raise ValueError(f"Unsupported input format: {ext or filepath}")
+
+def estimate_rows(filepath):
+    """Data rows in the file if cheaply known (for progress ETA), else None."""
+    ext = os.path.splitext(filepath)[1].lower()
+    if ext in (".xlsx", ".xlsm"):
+        from openpyxl import load_workbook
+
+        wb = load_workbook(filepath, read_only=True)
+        try:
+            max_row = wb.worksheets[0].max_row
+        finally:
+            wb.close()
+        return max_row - 1 if max_row else None
+    if ext == ".parquet":
+        import pyarrow.parquet as pq
+
+        return pq.ParquetFile(filepath).metadata.num_rows
+    return None
@@ -1,5 +1,7 @@
 import pandas as pd
-from neo4j import GraphDatabase
+from config.settings import INGEST_BATCH_SIZE
+from graph.neo4j_handler import Neo4jHandler
+from ingest.normalize import RowNormalizer
 
 # ---- CONFIG ----
 excel_file = "aapka file path"  # Replace with your actual Excel file
@@ -14,22 +16,18 @@ df = pd.read_excel(excel_file)
 
 df.dropna(subset=["questionText", "answerText"], inplace=True)
 
-# ---- Neo4j Driver Setup ----
-driver = GraphDatabase.driver(neo4j_uri, auth=(neo4j_user, neo4j_password))
+# ---- Neo4j Setup ----
+handler = Neo4jHandler(neo4j_uri, neo4j_user, neo4j_password)
+handler.ensure_schema()
 
 # ---- Ingest Data ----
-def create_graph(tx, question, answer):
-    tx.run("""
-        MERGE (q:Question {text: $question})
-        MERGE (a:Answer {text: $answer})
-        MERGE (q)-[:HAS_ANSWER]->(a)
-    """, question=question, answer=answer)
-
-with driver.session() as session:
-    for _, row in df.iterrows():
-        session.write_transaction(create_graph, row["questionText"], row["answerText"])
-
-driver.close()
+# Collapse duplicates in memory, then one UNWIND statement per batch
+normalizer = RowNormalizer()
+handler.add_question_answers(
+    normalizer.process(zip(df["questionText"], df["answerText"])),
+    batch_size=INGEST_BATCH_SIZE,
+)
+print(f"[INFO] Normalization removed {normalizer.removed} duplicate or empty rows.")
+
+handler.close()
 print("✅ Data pushed to GraphDB.")
-
-
@@ -0,0 +1,153 @@
+# telemetry/metrics.py
+"""Counters and histograms for the ingest hot path and the app.
+
+Disabled unless METRICS_ENABLED=1; then incr/observe/timer return
+immediately, so call sites can stay in hot loops. When enabled, values
+collect in a process-wide registry and flush() hands them to the sink
+selected by METRICS_SINK.
+"""
+import atexit
+import threading
+import time
+from bisect import bisect_left
+
+from config.settings import METRICS_ENABLED, METRICS_FILE, METRICS_FLUSH_INTERVAL, METRICS_SINK
+
+# Upper bounds in seconds, shared by every histogram
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class Histogram:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(BUCKETS, value)] += 1
+        self.total += value
+        self.count += 1
+
+class Registry:
+    def __init__(self):
+        self.counters = {}
+        self.histograms = {}
+        self.dirty = False
+        self._lock = threading.Lock()
+
+    def incr(self, name, value=1, labels=()):
+        key = (name, labels)
+        with self._lock:
+            self.dirty = True
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, value, labels=()):
+        key = (name, labels)
+        with self._lock:
+            self.dirty = True
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def snapshot(self):
+        """Plain-dict copy: {"counters": {...}, "histograms": {name: {count, sum, avg}}}."""
+        with self._lock:
+            return {
+                "counters": {_series(n, l): v for (n, l), v in self.counters.items()},
+                "histograms": {
+                    _series(n, l): {"count": h.count, "sum": h.total, "avg": h.total / h.count}
+                    for (n, l), h in self.histograms.items()
+                },
+            }
+
+    def prometheus_text(self):
+        lines = []
+        with self._lock:
+            for (name, labels), value in sorted(self.counters.items()):
+                lines.append(f"{_series(name, labels)} {value}")
+            for (name, labels), h in sorted(self.histograms.items()):
+                cumulative = 0
+                for bound, count in zip(BUCKETS + ("+Inf",), h.counts):
+                    cumulative += count
+                    lines.append(f"{_series(name + '_bucket', labels + (('le', bound),))} {cumulative}")
+                lines.append(f"{_series(name + '_sum', labels)} {h.total}")
+                lines.append(f"{_series(name + '_count', labels)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+def _series(name, labels):
+    if not labels:
+        return name
+    return name + "{" + ",".join(f'{k}="{v}"' for k, v in labels) + "}"
+
+def _labels(labels):
+    return tuple(sorted(labels.items()))
+
+registry = Registry()
+
+class _Timer:
+    __slots__ = ("name", "labels", "start")
+
+    def __init__(self, name, labels):
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        registry.observe(self.name, time.perf_counter() - self.start, self.labels)
+        return False
+
+class _NoopTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NOOP_TIMER = _NoopTimer()
+
+def incr(name, value=1, **labels):
+    if METRICS_ENABLED:
+        registry.incr(name, value, _labels(labels))
+
+def observe(name, seconds, **labels):
+    if METRICS_ENABLED:
+        registry.observe(name, seconds, _labels(labels))
+
+def timer(name, **labels):
+    """Context manager recording the block's wall time in histogram `name`."""
+    if not METRICS_ENABLED:
+        return _NOOP_TIMER
+    return _Timer(name, _labels(labels))
+
+_last_flush = time.monotonic()
+
+def flush():
+    """Hand the current values to the configured sink, if anything changed."""
+    global _last_flush
+    if not METRICS_ENABLED or not registry.dirty:
+        return
+    registry.dirty = False
+    _last_flush = time.monotonic()
+    if METRICS_SINK == "prometheus":
+        with open(METRICS_FILE, "w") as f:
+            f.write(registry.prometheus_text())
+    elif METRICS_SINK == "log":
+        snapshot = registry.snapshot()
+        for series, value in sorted(snapshot["counters"].items()):
+            print(f"[METRIC] {series} {value}")
+        for series, h in sorted(snapshot["histograms"].items()):
+            print(f"[METRIC] {series} count={h['count']} avg={1000 * h['avg']:.2f}ms")
+
+def maybe_flush():
+    """flush() at most every METRICS_FLUSH_INTERVAL seconds, for long-lived processes."""
+    if METRICS_ENABLED and time.monotonic() - _last_flush >= METRICS_FLUSH_INTERVAL:
+        flush()
+
+atexit.register(flush)
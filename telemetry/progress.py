@@ -0,0 +1,39 @@
+# telemetry/progress.py
+"""Throttled single-line progress with rate and ETA for long ingests."""
+import sys
+import time
+
+class Progress:
+    def __init__(self, total=None, label="rows", interval=1.0, stream=sys.stderr):
+        self.total = total
+        self.label = label
+        self.interval = interval
+        self.stream = stream
+        self.count = 0
+        self.start = time.monotonic()
+        self._last = 0.0
+
+    def track(self, items):
+        """Pass items through, counting them and redrawing at most every `interval` s."""
+        for item in items:
+            self.count += 1
+            yield item
+            if self.count & 1023 == 0:
+                now = time.monotonic()
+                if now - self._last >= self.interval:
+                    self._last = now
+                    self._draw(now)
+        self._draw(time.monotonic())
+        self.stream.write("\n")
+
+    def _draw(self, now):
+        elapsed = max(now - self.start, 1e-9)
+        rate = self.count / elapsed
+        line = f"[PROGRESS] {self.count:,} {self.label} • {rate:,.0f}/s • {elapsed:,.0f}s elapsed"
+        if self.total:
+            done = min(self.count / self.total, 1.0)
+            bar = "#" * int(done * 30)
+            eta = (self.total - self.count) / rate if rate else 0
+            line = f"[PROGRESS] [{bar:<30}] {done:4.0%} {self.count:,}/{self.total:,} {self.label} • {rate:,.0f}/s • ETA {eta:,.0f}s"
+        self.stream.write("\r" + line)
+        self.stream.flush()
@@ -0,0 +1,98 @@
+# views/chat.py
+import random
+
+import streamlit as st
+
+# Generic replies for when the graph has no answer or is unavailable
+MOCK_RESPONSES = (
+    "I understand this must be difficult for you. Can you tell me more about what you're experiencing?",
+    "It sounds like you're going through a challenging time. Remember that seeking support is a sign of strength.",
+    "Thank you for sharing that with me. Have you considered speaking with a mental health professional?",
+    "Your feelings are valid. Here are some coping strategies that might help...",
+    "I'm here to listen. Sometimes talking through our thoughts can provide clarity.",
+)
+
+@st.cache_resource
+def get_neo4j_handler():
+    # One pooled driver per server process, reused across reruns and sessions
+    from graph.neo4j_handler import Neo4jHandler
+    return Neo4jHandler()
+
+@st.cache_resource
+def get_answer_lookup():
+    # Process-wide, so common messages are answered from memory for everyone
+    from config.settings import VECTOR_MIN_SCORE
+    from graph.answer_cache import CachedAnswerLookup
+    from graph.vector_index import VectorIndex
+    handler = get_neo4j_handler()
+    index = VectorIndex()
+    if not index.exists():
+        return CachedAnswerLookup(handler.find_answers)
+    return CachedAnswerLookup(
+        lambda text, k: handler.find_similar_answers(text, index, k=k, min_score=VECTOR_MIN_SCORE)
+    )
+
+def render():
+    st.title("🤖 AI Support Chat")
+    st.markdown("*Note: Answers come from our Q&A knowledge graph when a match is found. This is not a substitute for professional help.*")
+    
+    # Chat container
+    chat_container = st.container()
+    
+    with chat_container:
+        # Display chat messages
+        for message in st.session_state.chat_messages:
+            if message["role"] == "user":
+                st.markdown(f"**You:** {message['content']}")
+            else:
+                st.markdown(f"**AI Support:** {message['content']}")
+        
+        if 'retrieval_stats' in st.session_state:
+            stats = st.session_state.retrieval_stats
+            st.caption(
+                f"Answer cache: {stats['hit_rate']:.0%} hit rate • {stats['size']}/{stats['maxsize']} entries • "
+                f"last DB lookup {stats['last_lookup_ms']:.1f} ms (avg {stats['avg_lookup_ms']:.1f} ms)"
+            )
+        
+        st.divider()
+    
+    # Chat input
+    with st.form("chat_form"):
+        user_input = st.text_area("Type your message...", height=80, placeholder="Share what's on your mind...")
+        col1, col2 = st.columns([1, 4])
+        with col1:
+            if st.form_submit_button("Send 💙"):
+                if user_input:
+                    # Add user message
+                    st.session_state.chat_messages.append({"role": "user", "content": user_input})
+                    
+                    # Look the message up in the Q&A graph
+                    from neo4j.exceptions import DriverError, Neo4jError
+                    ai_response = None
+                    try:
+                        answer_lookup = get_answer_lookup()
+                        results = answer_lookup.find_answers(user_input, k=1)
+                        st.session_state.retrieval_stats = answer_lookup.stats()
+                        if results:
+                            ai_response = results[0]["answer"]
+                    except (DriverError, Neo4jError):
+                        pass  # Graph unavailable: fall back to a generic reply
+                    
+                    if ai_response is None:
+                        ai_response = random.choice(MOCK_RESPONSES)
+                    st.session_state.chat_messages.append({"role": "assistant", "content": ai_response})
+                    
+                    st.rerun()
+    
+    # Quick actions
+    st.markdown("### Quick Actions")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if st.button("🆘 Crisis Resources"):
+            st.info("🚨 **Emergency:** 911\n📞 **988 Suicide & Crisis Lifeline:** Call or text 988\n💬 **Crisis Text Line:** Text HOME to 741741\n📞 **NAMI HelpLine:** 1-800-950-6264\n\n[More crisis resources](https://988lifeline.org/)")
+    with col2:
+        if st.button("🧘 Breathing Exercise"):
+            st.info("**4-7-8 Breathing Technique:**\n• Inhale through nose for 4 counts\n• Hold breath for 7 counts\n• Exhale through mouth for 8 counts\n• Repeat 3-4 times\n\n[Watch Dr. Weil's Tutorial](https://www.drweil.com/videos-features/videos/breathing-exercises-4-7-8-breath/)")
+    with col3:
+        if st.button("🌟 Grounding Technique"):
+            st.info("**5-4-3-2-1 Grounding:**\n• 5 things you can see\n• 4 things you can touch\n• 3 things you can hear\n• 2 things you can smell\n• 1 thing you can taste\n\n[Complete Guide](https://www.verywellmind.com/5-4-3-2-1-grounding-technique-8639390)")
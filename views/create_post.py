@@ -0,0 +1,49 @@
+# views/create_post.py
+import streamlit as st
+
+from views.shared import get_feed
+
+def render():
+    st.title("✍️ Create New Post")
+    st.markdown("Share your thoughts, feelings, or ask for support from the community.")
+    
+    with st.form("new_post_form"):
+        st.markdown("### Your Post")
+        
+        # Anonymous option
+        is_anonymous = st.checkbox("Post anonymously")
+        
+        # Post content
+        post_content = st.text_area(
+            "What's on your mind?",
+            height=150,
+            placeholder="Share your thoughts, feelings, or ask for support. Remember, this is a safe space."
+        )
+        
+        # Tags
+        st.markdown("### Tags (optional)")
+        col1, col2 = st.columns(2)
+        with col1:
+            tag_input = st.text_input("Add tags (comma-separated)", placeholder="stress, anxiety, support")
+        
+        # Mood selector
+        with col2:
+            mood = st.selectbox("Current mood", ["😊 Good", "😐 Okay", "😔 Struggling", "😰 Anxious", "😴 Tired"])
+        
+        # Submit button
+        submitted = st.form_submit_button("🚀 Share Post", use_container_width=True)
+        
+        if submitted:
+            if post_content:
+                # Parse tags
+                tags = [tag.strip() for tag in tag_input.split(',') if tag.strip()]
+                
+                # Create new post
+                # Queued: the write happens in the background
+                st.session_state.pending_writes.append(
+                    get_feed().create_post('Anonymous' if is_anonymous else 'You', post_content, tags)
+                )
+                st.toast("Post shared successfully! 🎉")
+                st.rerun()
+            else:
+                st.error("Please write something before posting.")
@@ -0,0 +1,95 @@
+# views/feed.py
+import streamlit as st
+
+from config.settings import FEED_PAGE_SIZE, FEED_REPLY_PREVIEW, FEED_WRITE_WAIT
+from views.shared import get_feed
+
+def render():
+    st.title("💬 Community Feed")
+    st.markdown("Connect with others and share your mental health journey in a supportive environment.")
+    
+    # Filter options
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        search_term = st.text_input("🔍 Search posts...", placeholder="Search by content or tags")
+    with col2:
+        sort_by = st.selectbox("Sort by", ["Recent", "Most Replies"])
+    
+    # Tag filter
+    feed = get_feed()
+    
+    # Make sure this session's own queued writes are visible before rendering
+    if st.session_state.pending_writes:
+        done = feed.wait(st.session_state.pending_writes, timeout=FEED_WRITE_WAIT)
+        for future in done:
+            if future.exception():
+                st.error("Sorry, one of your posts or replies could not be saved. Please try again.")
+        st.session_state.pending_writes = [f for f in st.session_state.pending_writes if f not in done]
+    
+    selected_tags = st.multiselect("Filter by tags", feed.tags())
+    
+    st.divider()
+    
+    # Only render a window of posts; "Load more" widens it. A new search,
+    # filter or sort starts again from the first page.
+    feed_view = (search_term, tuple(selected_tags), sort_by)
+    if st.session_state.get('feed_view') != feed_view:
+        st.session_state.feed_view = feed_view
+        st.session_state.feed_limit = FEED_PAGE_SIZE
+    feed_limit = st.session_state.feed_limit
+    
+    # Search, filter and sort via the index instead of scanning every post
+    filtered_posts = feed.query(search_term, selected_tags, sort_by, limit=feed_limit + 1)
+    has_more = len(filtered_posts) > feed_limit
+    
+    expanded_replies = st.session_state.setdefault('expanded_replies', set())
+    
+    for post in filtered_posts[:feed_limit]:
+        with st.container():
+            st.markdown(f"**{post.author}** • {post.timestamp.strftime('%Y-%m-%d %H:%M')}")
+            st.markdown(post.content)
+            
+            # Tags
+            if post.tags:
+                tag_html = " ".join([f"<span style='background-color: #e1f5fe; padding: 2px 8px; border-radius: 12px; font-size: 0.8em; color: #01579b;'>#{tag}</span>" for tag in post.tags])
+                st.markdown(tag_html, unsafe_allow_html=True)
+            
+            # Reply section: long threads show the latest replies until expanded
+            if post.replies:
+                with st.expander(f"💬 {len(post.replies)} replies", expanded=len(post.replies) <= 2):
+                    show_all = post.id in expanded_replies
+                    shown = post.replies if show_all else post.replies[-FEED_REPLY_PREVIEW:]
+                    if len(shown) < len(post.replies):
+                        if st.button(f"Show all {len(post.replies)} replies", key=f"show_replies_{post.id}"):
+                            expanded_replies.add(post.id)
+                            st.rerun()
+                    for reply in shown:
+                        st.markdown(f"**{reply.author}** • {reply.timestamp.strftime('%Y-%m-%d %H:%M')}")
+                        st.markdown(f"↳ {reply.content}")
+                        st.markdown("---")
+            
+            # Reply form is only built for the post being replied to
+            if st.session_state.get('reply_form_post') == post.id:
+                # Add reply form
+                with st.form(f"reply_form_{post.id}"):
+                    reply_content = st.text_area("Add a supportive reply...", key=f"reply_{post.id}", height=80)
+                    col1, col2 = st.columns([1, 4])
+                    with col1:
+                        if st.form_submit_button("💙 Reply"):
+                            if reply_content:
+                                st.session_state.pending_writes.append(
+                                    feed.add_reply(post.id, 'You', reply_content)
+                                )
+                                st.session_state.reply_form_post = None
+                                st.toast("Reply added!")
+                                st.rerun()
+            elif st.button("💙 Reply", key=f"open_reply_{post.id}"):
+                st.session_state.reply_form_post = post.id
+                st.rerun()
+            
+            st.divider()
+    
+    if has_more:
+        if st.button("Load more posts", use_container_width=True):
+            st.session_state.feed_limit = feed_limit + FEED_PAGE_SIZE
+            st.rerun()
@@ -0,0 +1,140 @@
+# views/resources.py
+import streamlit as st
+
+def render():
+    st.title("📚 Mental Health Resources")
+    
+    # Crisis resources
+    st.markdown("## 🆘 Crisis Resources")
+    crisis_col1, crisis_col2 = st.columns(2)
+    
+    with crisis_col1:
+        st.markdown("""
+        **Immediate Help:**
+        - 🔴 **Emergency:** 911
+        - 💬 **Crisis Text Line:** Text HOME to 741741
+        - 📞 **988 Suicide & Crisis Lifeline:** Call or text 988 (24/7)
+        - 📞 **NAMI HelpLine:** 1-800-950-6264 (M-F, 10 AM-10 PM ET)
+        - 📞 **National Mental Health Hotline:** 1-866-903-3787
+        """)
+    
+    with crisis_col2:
+        st.markdown("""
+        **Text Options:**
+        - Text "NAMI" to 62640 (NAMI)
+        - Text "TalkWithUs" to 66746 (Disaster Distress)
+        - Text "HELLO" to 741741 (Crisis Text Line)
+        
+        **International:**
+        - 🇬🇧 **UK:** 116 123 (Samaritans)
+        - 🇨🇦 **Canada:** 1-833-456-4566
+        - 🇦🇺 **Australia:** 13 11 14 (Lifeline)
+        """)
+    
+    st.divider()
+    
+    # Self-care tools
+    st.markdown("## 🧘 Self-Care Tools & Techniques")
+    
+    tool_col1, tool_col2, tool_col3 = st.columns(3)
+    
+    with tool_col1:
+        st.markdown("""
+        **Breathing Exercises:**
+        - [4-7-8 Breathing Guide](https://www.drweil.com/videos-features/videos/breathing-exercises-4-7-8-breath/) - Dr. Weil's original technique
+        - [4-7-8 Technique Tutorial](https://www.healthline.com/health/4-7-8-breathing) - Step-by-step guide
+        - [Box Breathing Animation](https://lassebomh.github.io/box-breathing/) - Visual breathing guide
+        - [10 Breathing Techniques](https://www.healthline.com/health/breathing-exercise) - Various methods
+        """)
+    
+    with tool_col2:
+        st.markdown("""
+        **Grounding Techniques:**
+        - [5-4-3-2-1 Grounding Guide](https://www.verywellmind.com/5-4-3-2-1-grounding-technique-8639390) - Complete tutorial
+        - [Grounding Techniques Worksheet](https://www.therapistaid.com/therapy-worksheet/grounding-techniques) - Printable resource
+        - [18 Grounding Methods](https://www.calm.com/blog/grounding-techniques) - Various techniques
+        - [Anxiety Grounding Guide](https://www.urmc.rochester.edu/behavioral-health-partners/bhp-blog/april-2018/5-4-3-2-1-coping-technique-for-anxiety) - University resource
+        """)
+    
+    with tool_col3:
+        st.markdown("""
+        **Relaxation & Mindfulness:**
+        - [Progressive Muscle Relaxation](https://www.helpguide.org/mental-health/meditation/progressive-muscle-relaxation-meditation) - Complete guide
+        - [PMR Script](https://www.therapistaid.com/worksheets/progressive-muscle-relaxation-script) - Guided script
+        - [Mindfulness Meditation](https://www.headspace.com/meditation) - Guided sessions
+        - [Calm App](https://www.calm.com/) - Meditation & sleep stories
+        """)
+    
+    st.divider()
+    
+    # Professional help
+    st.markdown("## 👩‍⚕️ Professional Help")
+    
+    prof_col1, prof_col2 = st.columns(2)
+    
+    with prof_col1:
+        st.markdown("""
+        **Finding a Therapist:**
+        - [Psychology Today](https://www.psychologytoday.com/us/therapists) - Therapist directory
+        - [GoodTherapy.org](https://www.goodtherapy.org/) - Therapist finder
+        - [988lifeline.org](https://988lifeline.org/) - Crisis support & resources
+        - [NAMI.org](https://www.nami.org/) - Mental health support
+        - Your insurance provider's website
+        - Community mental health centers
+        - Employee assistance programs (EAP)
+        """)
+    
+    with prof_col2:
+        st.markdown("""
+        **Types of Therapy:**
+        - **Cognitive Behavioral Therapy (CBT)** - Thought patterns
+        - **Dialectical Behavior Therapy (DBT)** - Emotional regulation
+        - **Acceptance and Commitment Therapy (ACT)** - Mindfulness-based
+        - **EMDR** - Trauma processing
+        - **Interpersonal Therapy (IPT)** - Relationship focus
+        - **Psychodynamic Therapy** - Unconscious patterns
+        """)
+    
+    st.divider()
+    
+    # Educational resources
+    st.markdown("## 📖 Educational Resources & Online Tools")
+    
+    with st.expander("🧠 Mental Health Apps & Online Resources"):
+        st.markdown("""
+        **Crisis Support:**
+        - [988lifeline.org](https://988lifeline.org/) - 24/7 crisis support
+        - [Crisis Text Line](https://www.crisistextline.org/) - Text-based crisis support
+        - [NAMI](https://www.nami.org/) - Mental health education & support
+        
+        **Self-Help & Coping:**
+        - Headspace, Calm, Insight Timer (meditation apps)
+        - Youper, Sanvello, MindShift (mood tracking apps)
+        - DBT Coach, CBT Thought Record (therapy skill apps)
+        """)
+    
+    with st.expander("📚 Understanding Mental Health Conditions"):
+        st.markdown("""
+        - **Anxiety Disorders:** Excessive worry, fear, or panic attacks
+        - **Depression:** Persistent sadness, loss of interest, hopelessness
+        - **PTSD:** Trauma-related flashbacks, nightmares, hypervigilance
+        - **Bipolar Disorder:** Alternating mood episodes (mania/depression)
+        - **OCD:** Obsessive thoughts and compulsive behaviors
+        - **ADHD:** Attention difficulties, hyperactivity, impulsivity
+        """)
+    
+    with st.expander("🛠️ Coping Strategies & Techniques"):
+        st.markdown("""
+        **Immediate Coping:**
+        - **5-4-3-2-1 Grounding:** [Complete Guide](https://www.verywellmind.com/5-4-3-2-1-grounding-technique-8639390) - Identify 5 things you see, 4 you touch, 3 you hear, 2 you smell, 1 you taste
+        - **Box Breathing:** [Visual Guide](https://lassebomh.github.io/box-breathing/) - 4-4-4-4 pattern (inhale-hold-exhale-hold)
+        - **Progressive Muscle Relaxation:** [Tutorial](https://www.helpguide.org/mental-health/meditation/progressive-muscle-relaxation-meditation) - Tense and release muscle groups
+        - **Cold Water Technique:** Run cold water on wrists/face for instant calm
+        
+        **Daily Management:**
+        - **Sleep Hygiene:** [Sleep Foundation Guide](https://www.sleepfoundation.org/sleep-hygiene) - 7-9 hours, consistent schedule
+        - **Physical Activity:** [Exercise for Mental Health](https://www.mayoclinic.org/diseases-conditions/depression/in-depth/depression-and-exercise/art-20046495) - Even 10-minute walks help
+        - **Mindfulness:** [Headspace](https://www.headspace.com/) or [Calm](https://www.calm.com/) apps for guided meditation
+        - **Journaling:** [Mental Health Journaling Guide](https://www.helpguide.org/mental-health/wellbeing/journaling-for-mental-health-and-wellness) - Track thoughts and feelings
+        - **Social Support:** Regular check-ins with trusted friends/family
+        """)
@@ -0,0 +1,43 @@
+# views/shared.py
+"""Process-wide feed shared by the Community Feed and Create Post pages."""
+import time
+
+import streamlit as st
+
+from feed.models import Post, Reply
+from feed.store import open_feed
+
+def seed_posts():
+    now = int(time.time())
+    return [
+        Post(
+            1, 'Sarah M.', now - 2 * 3600,
+            'Feeling overwhelmed with work stress lately. Anyone else dealing with similar feelings?',
+            ['stress', 'work'],
+            [
+                Reply('Mike K.', now - 3600, 'I completely understand. Taking short breaks throughout the day has helped me manage work stress better.'),
+                Reply('Lisa R.', now - 30 * 60, 'Have you tried the 5-4-3-2-1 grounding technique? It really helps when I feel overwhelmed.'),
+            ],
+        ),
+        Post(
+            2, 'Alex T.', now - 5 * 3600,
+            'Started therapy last week and feeling hopeful for the first time in months. Just wanted to share some positivity!',
+            ['therapy', 'hope', 'positivity'],
+            [
+                Reply('Emma D.', now - 3 * 3600, 'That\'s wonderful! Taking that first step is always the hardest. Proud of you! 💪'),
+            ],
+        ),
+        Post(
+            3, 'Jordan P.', now - 24 * 3600,
+            'Having trouble sleeping again. Any natural remedies that have worked for you?',
+            ['sleep', 'insomnia'],
+        ),
+    ]
+
+@st.cache_resource
+def get_feed():
+    # Shared by every session; seeded with example posts on first launch
+    feed = open_feed()
+    if feed.is_empty():
+        feed.import_posts(seed_posts())
+    return feed